@@ -1,4 +1,24 @@
+from lsmtree.domain.dtypes.compaction import Compaction
+from lsmtree.domain.dtypes.compression import Compression
+from lsmtree.domain.dtypes.durability import Durability
+from lsmtree.domain.entities.bloomfilter_policy import BloomFilterPolicy
+from lsmtree.domain.entities.cache_info import CacheInfo
+from lsmtree.domain.entities.compaction_info import CompactionInfo
+from lsmtree.infrastructure.adapters.arena_memtable import ArenaMemTable
+from lsmtree.infrastructure.adapters.memtable import MemTable
 from lsmtree.presentation.lsmtree import LSMTree
+from lsmtree.presentation.write_batch import WriteBatch
 
 
-__all__ = ["LSMTree"]
+__all__ = [
+    "ArenaMemTable",
+    "BloomFilterPolicy",
+    "CacheInfo",
+    "Compaction",
+    "CompactionInfo",
+    "Compression",
+    "Durability",
+    "LSMTree",
+    "MemTable",
+    "WriteBatch",
+]
@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class Compaction(StrEnum):
+    """Стратегия компакции уровней.
+
+    Примечания:
+        * `LEVELED` - уровень - один прогон, и данные переписываются на каждом уровне;
+        * `SIZE_TIERED` - уровень копит прогоны, и сливаются лишь прогоны одного уровня;
+        * `LEVELED` экономит чтение и место, `SIZE_TIERED` - запись.
+    """
+
+    LEVELED = "leveled"
+    SIZE_TIERED = "size-tiered"
@@ -0,0 +1,14 @@
+from enum import IntEnum
+
+
+class Compression(IntEnum):
+    """Алгоритм сжатия блоков `SSTable`.
+
+    Примечания:
+        * Значение хранится в трейлере блока, поэтому не должно меняться.
+    """
+
+    NONE = 0
+    ZLIB = 1
+    BZ2 = 2
+    LZMA = 3
@@ -0,0 +1,15 @@
+from enum import StrEnum
+
+
+class Durability(StrEnum):
+    """Режим долговечности журнала предзаписи.
+
+    Примечания:
+        * `NONE` - записи сразу передаются ядру, но `fsync` не вызывается;
+        * `GROUP` - записи сразу передаются ядру, `fsync` идет раз в N записей или T миллисекунд;
+        * `SYNC` - каждая запись завершается вызовом `fsync`.
+    """
+
+    NONE = "none"
+    GROUP = "group"
+    SYNC = "sync"
@@ -0,0 +1,7 @@
+class Uint64(int):
+    """64-битное целое число."""
+
+    bytes: int = 8
+
+    min: int = 0
+    max: int = 2 ** 64 - 1
@@ -0,0 +1,38 @@
+import math
+
+from dataclasses import dataclass
+from typing import Self
+
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt
+
+
+@dataclass(frozen=True)
+class BloomFilterPolicy:
+    """Политика построения фильтра Блума."""
+
+    bits_per_key: PositiveInt = 10
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        if self.bits_per_key <= 0:
+            detail = "The number of bits per key must be positive"
+            raise ValueError(detail)
+
+    @classmethod
+    def from_false_positive_rate(cls: type[Self], rate: float) -> Self:
+        """Построить политику по желаемой доле ложноположительных срабатываний."""
+        if not (0 < rate < 1):
+            detail = "The false positive rate must be between 0 and 1"
+            raise ValueError(detail)
+
+        bits_per_key = math.ceil(-math.log(rate) / (math.log(2) ** 2))
+        return cls(bits_per_key)
+
+    @property
+    def number_of_hashes(self: Self) -> PositiveInt:
+        """Получить оптимальное число хэшей."""
+        return max(1, round(self.bits_per_key * math.log(2)))
+
+    def get_number_of_bits(self: Self, number_of_keys: NonNegativeInt) -> PositiveInt:
+        """Получить размер фильтра Блума для заданного числа ключей."""
+        return max(64, number_of_keys * self.bits_per_key)
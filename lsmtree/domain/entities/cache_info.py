@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from lsmtree.utils.typing import NonNegativeInt
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Статистика кэша."""
+
+    hits: NonNegativeInt
+    misses: NonNegativeInt
+    capacity: NonNegativeInt
+    size: NonNegativeInt
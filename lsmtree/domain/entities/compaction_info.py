@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from lsmtree.utils.typing import NonNegativeInt
+
+
+@dataclass(frozen=True)
+class CompactionInfo:
+    """Статистика слияний."""
+
+    # Число надгробий, отброшенных из-за отсутствия более старых версий ключа
+    tombstones_dropped: NonNegativeInt
+
+    # Размер ключей и значений, не попавших в результаты слияний [в байтах]
+    # Примечание: учитываются отброшенные надгробия и перекрытые более новыми версии
+    bytes_reclaimed: NonNegativeInt
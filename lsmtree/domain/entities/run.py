@@ -0,0 +1,54 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.entities.table_info import TableInfo
+from lsmtree.utils.typing import NonNegativeInt
+
+
+@dataclass(frozen=True)
+class Run:
+    """Сущность отсортированного прогона.
+
+    Примечания:
+        * Прогон - упорядоченные по ключам таблицы, диапазоны которых не пересекаются;
+        * Уровень состоит из одного или нескольких прогонов, упорядоченных от новых к старым.
+    """
+
+    infos: tuple[TableInfo, ...] = ()
+
+    @property
+    def size(self: Self) -> NonNegativeInt:
+        """Получить суммарный размер таблиц прогона."""
+        return sum(info.size for info in self.infos)
+
+    def find(self: Self, key: Bytes32) -> TableInfo | None:
+        """Найти таблицу прогона, в диапазон которой попадает ключ."""
+        position = bisect_left(self.infos, key, key=attrgetter("largest"))
+
+        if position < len(self.infos) and self.infos[position].smallest <= key:
+            return self.infos[position]
+
+        return None
+
+    def get_overlapping(
+        self: Self,
+        smallest: Bytes32 | None = None,
+        largest: Bytes32 | None = None,
+    ) -> list[TableInfo]:
+        """Получить таблицы прогона, пересекающие отрезок `[smallest, largest]`.
+
+        Примечания:
+            * Отсутствующая граница отрезка считается бесконечной.
+        """
+        start, stop = 0, len(self.infos)
+
+        if smallest is not None:
+            start = bisect_left(self.infos, smallest, key=attrgetter("largest"))
+
+        if largest is not None:
+            stop = bisect_right(self.infos, largest, key=attrgetter("smallest"))
+
+        return list(self.infos[start:stop])
@@ -3,6 +3,7 @@ from functools import cached_property
 from typing import Self
 
 from lsmtree.domain.entities.level import Level
+from lsmtree.domain.entities.table import Table
 from lsmtree.utils.typing import DirectoryPath, FilePath, PositiveInt, SortedIterator
 
 
@@ -21,23 +22,52 @@ class Storage:
         """Путь до журнала предзаписи."""
         return self.root / "wal.db"
 
+    @cached_property
+    def immutable_wal(self: Self) -> FilePath:
+        """Путь до журнала предзаписи неизменяемой `MemTable`, ожидающей выгрузки."""
+        return self.root / "wal-immutable.db"
+
+    @cached_property
+    def manifest(self: Self) -> FilePath:
+        """Путь до манифеста: списка таблиц каждого уровня."""
+        return self.root / "manifest.db"
+
+    @cached_property
+    def manifest_sandbox(self: Self) -> FilePath:
+        """Путь до новой версии манифеста, которая подменит текущую переименованием."""
+        return self.root / "manifest-sandbox.db"
+
     @cached_property
     def levels(self: Self) -> DirectoryPath:
-        """Путь до директории уровней."""
+        """Путь до директории уровней устаревшего формата."""
         return self.root / "levels"
 
-    def get_level(self: Self, serial: PositiveInt) -> Level:
-        """Получить сущность уровня."""
-        path = self.levels / str(serial)
-        return Level(path)
+    @cached_property
+    def tables(self: Self) -> DirectoryPath:
+        """Путь до директории таблиц."""
+        return self.root / "tables"
+
+    def get_table(self: Self, serial: PositiveInt) -> Table:
+        """Получить сущность таблицы."""
+        path = self.tables / str(serial)
+        return Table(path)
+
+    def get_serials(self: Self) -> list[PositiveInt]:
+        """Получить номера таблиц, лежащих на диске."""
+        if not self.tables.exists():
+            return []
 
-    def get_first_level(self: Self) -> Level:
-        """Получить сущность первого уровня."""
-        return self.get_level(serial=1)
+        return [int(path.name) for path in self.tables.glob("*") if path.name.isdigit()]
 
     def __iter__(self: Self) -> SortedIterator[Level]:
-        """Получить итератор по заполненным уровням."""
-        for path in sorted(self.levels.glob("*")):
+        """Получить итератор по заполненным уровням устаревшего формата.
+
+        Примечания:
+            * Уровни упорядочены по номеру, не по имени директории: `2` идет раньше `10`.
+        """
+        paths = (path for path in self.levels.glob("*") if path.name.isdigit())
+
+        for path in sorted(paths, key=lambda path: int(path.name)):
             level = Level(path)
             if not level.is_empty():
                 yield level
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.entities.table import Table
+from lsmtree.utils.typing import NonNegativeInt
+
+
+@dataclass(frozen=True)
+class TableInfo:
+    """Сведения про таблицу уровня."""
+
+    table: Table
+
+    # Наименьший и наибольший ключи таблицы
+    smallest: Bytes32
+    largest: Bytes32
+
+    # Размер файла таблицы [в байтах]
+    size: NonNegativeInt
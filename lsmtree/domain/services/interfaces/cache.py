@@ -0,0 +1,35 @@
+from abc import abstractmethod
+from collections.abc import Hashable
+from typing import Protocol, Self, TypeVar
+
+from lsmtree.domain.entities.cache_info import CacheInfo
+from lsmtree.utils.typing import NonNegativeInt
+
+
+# Ключ лишь принимается методами кэша, поэтому переменная контравариантна
+K_contra = TypeVar("K_contra", bound=Hashable, contravariant=True)
+V = TypeVar("V")
+
+
+class Cache(Protocol[K_contra, V]):
+    """Интерфейс кэша, ограниченного по размеру в байтах."""
+
+    @abstractmethod
+    def get(self: Self, key: K_contra) -> V | None:
+        """Получить значение по ключу, если оно закэшировано."""
+
+    @abstractmethod
+    def put(self: Self, key: K_contra, value: V, size: NonNegativeInt) -> None:
+        """Закэшировать значение по ключу."""
+
+    @abstractmethod
+    def pop(self: Self, key: K_contra) -> V | None:
+        """Удалить значение по ключу из кэша и получить удаленное значение."""
+
+    @abstractmethod
+    def clear(self: Self) -> None:
+        """Очистить кэш."""
+
+    @abstractmethod
+    def cache_info(self: Self) -> CacheInfo:
+        """Получить статистику кэша."""
@@ -0,0 +1,24 @@
+from abc import abstractmethod
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from typing import Protocol, Self
+
+from lsmtree.domain.services.interfaces.compaction_strategy import CompactionStrategy
+from lsmtree.domain.services.interfaces.manifest import Manifest
+from lsmtree.utils.typing import PositiveInt
+
+
+@dataclass
+class CompactionScheduler(Protocol):
+    """Интерфейс планировщика компакции."""
+
+    manifest: Manifest
+    strategy: CompactionStrategy
+
+    @abstractmethod
+    def reserve_first_level(self: Self) -> AbstractContextManager[PositiveInt]:
+        """Зарезервировать первый уровень под выгрузку `MemTable` и получить номер уровня."""
+
+    @abstractmethod
+    def close(self: Self) -> None:
+        """Дождаться текущей задачи и остановить компакцию."""
@@ -0,0 +1,36 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Protocol, Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.services.interfaces.manifest import Manifest
+from lsmtree.domain.services.interfaces.merger import Merger
+from lsmtree.utils.typing import PositiveInt, SortedIterable
+
+
+@dataclass
+class CompactionStrategy(Protocol):
+    """Интерфейс стратегии компакции."""
+
+    manifest: Manifest
+    merger: Merger
+
+    @abstractmethod
+    def flush(
+        self: Self,
+        serial: PositiveInt,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+    ) -> None:
+        """Выгрузить пары `MemTable` на уровень."""
+
+    @abstractmethod
+    def get_pressure(self: Self, serial: PositiveInt) -> float:
+        """Получить давление уровня: при давлении не меньше единицы уровень нужно компактить."""
+
+    @abstractmethod
+    def must_stall(self: Self, serial: PositiveInt) -> bool:
+        """Проверить, должна ли выгрузка на уровень ждать компакции уровня."""
+
+    @abstractmethod
+    def compact(self: Self, serial: PositiveInt) -> None:
+        """Перенести данные уровня на следующий уровень."""
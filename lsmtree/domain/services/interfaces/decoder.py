@@ -0,0 +1,29 @@
+from abc import abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Generic, Self, TypeVar
+
+from lsmtree.utils.typing import NonNegativeInt
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Decoder(Generic[T]):
+    """Оператор пакетного разбора."""
+
+    data: bytes | memoryview
+
+    @abstractmethod
+    def __iter__(self: Self) -> Iterator[T]:
+        """Получить итератор по разобранным значениям."""
+
+    @abstractmethod
+    def is_broken(self: Self) -> bool:
+        """Проверить, оборвана ли последняя запись."""
+
+    @property
+    @abstractmethod
+    def offset(self: Self) -> NonNegativeInt:
+        """Получить смещение конца последней разобранной записи."""
@@ -0,0 +1,26 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import BinaryIO, Generic, Self, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Encoder(Generic[T]):
+    """Оператор пакетной записи."""
+
+    buffer: BinaryIO
+
+    @abstractmethod
+    def write(self: Self, data: T) -> None:
+        """Упаковать значение в блок."""
+
+    @abstractmethod
+    def write_many(self: Self, iterable: Iterable[T]) -> None:
+        """Упаковать значения в блок."""
+
+    @abstractmethod
+    def flush(self: Self) -> None:
+        """Записать упакованный блок в буффер."""
@@ -0,0 +1,51 @@
+from abc import abstractmethod
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Protocol, Self
+
+from lsmtree.domain.entities.run import Run
+from lsmtree.domain.entities.storage import Storage
+from lsmtree.domain.entities.table import Table
+from lsmtree.domain.entities.table_info import TableInfo
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt, SortedIterator
+
+
+@dataclass
+class Manifest(Protocol):
+    """Интерфейс манифеста."""
+
+    storage: Storage
+
+    @abstractmethod
+    def get_level(self: Self, serial: PositiveInt) -> list[Run]:
+        """Получить прогоны уровня от новых к старым."""
+
+    @abstractmethod
+    def get_size(self: Self, serial: PositiveInt) -> NonNegativeInt:
+        """Получить суммарный размер таблиц уровня."""
+
+    @abstractmethod
+    def create_table(self: Self) -> Table:
+        """Создать таблицу под новым номером."""
+
+    @abstractmethod
+    def apply(
+        self: Self,
+        removed: Iterable[TableInfo],
+        added: Mapping[PositiveInt, Iterable[TableInfo]],
+        *,
+        separate: bool = False,
+    ) -> None:
+        """Атомарно убрать и добавить таблицы."""
+
+    @abstractmethod
+    def collect_garbage(self: Self) -> None:
+        """Удалить таблицы, которых нет в манифесте."""
+
+    @abstractmethod
+    def __contains__(self: Self, table: Table) -> bool:
+        """Проверить, учтена ли таблица в манифесте."""
+
+    @abstractmethod
+    def __iter__(self: Self) -> SortedIterator[tuple[PositiveInt, list[Run]]]:
+        """Получить итератор по заполненным уровням."""
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import Protocol, Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
@@ -15,6 +16,10 @@ class MemTable(Protocol):
     def put(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
         """Записать значение по ключу."""
 
+    @abstractmethod
+    def put_many(self: Self, pairs: Iterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Атомарно записать пакет пар."""
+
     @abstractmethod
     def get(self: Self, key: Bytes32) -> Bytes32 | None:
         """Получить значение по ключу."""
@@ -35,3 +40,17 @@ class MemTable(Protocol):
     @abstractmethod
     def __iter__(self: Self) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
         """Получить итератор по упорядоченным парам."""
+
+    @abstractmethod
+    def seek(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по упорядоченным парам, начиная от первого ключа не меньше данного."""
+
+    @abstractmethod
+    def seek_reverse(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по парам, начиная от последнего ключа меньше данного."""
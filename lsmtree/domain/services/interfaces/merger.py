@@ -1,7 +1,10 @@
 from abc import abstractmethod
 from typing import Protocol, Self
 
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.entities.compaction_info import CompactionInfo
 from lsmtree.domain.entities.level import Level
+from lsmtree.utils.typing import PositiveInt, SortedIterable
 
 
 class Merger(Protocol):
@@ -9,4 +12,28 @@ class Merger(Protocol):
 
     @abstractmethod
     def merge(self: Self, level: Level) -> None:
-        """Выполнить операцию слияния."""
+        """Перевести уровень устаревшего формата в манифест."""
+
+    @abstractmethod
+    def merge_down(self: Self, serial: PositiveInt) -> None:
+        """Перенести одну таблицу уровня на следующий уровень."""
+
+    @abstractmethod
+    def add_run(
+        self: Self,
+        serial: PositiveInt,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+    ) -> None:
+        """Записать пары новым прогоном уровня."""
+
+    @abstractmethod
+    def merge_runs(self: Self, serial: PositiveInt) -> None:
+        """Слить все прогоны уровня в новый прогон следующего уровня."""
+
+    @abstractmethod
+    def merge_runs_down(self: Self, serial: PositiveInt) -> None:
+        """Слить все прогоны уровня и пересекающие их таблицы следующего уровня."""
+
+    @abstractmethod
+    def compaction_info(self: Self) -> CompactionInfo:
+        """Получить статистику слияний."""
@@ -18,6 +18,22 @@ class SparseIndex(Protocol):
     def get(self: Self, key: Bytes32) -> Uint1024:
         """Получить ближайшее к ключу смещение."""
 
+    @abstractmethod
+    def search(self: Self, key: Bytes32, start: NonNegativeInt = 0) -> int:
+        """Получить позицию ближайшего к ключу смещения."""
+
+    @abstractmethod
+    def __getitem__(self: Self, position: NonNegativeInt) -> tuple[Bytes32, Uint1024]:
+        """Получить пару 'ключ-смещение' по позиции."""
+
+    @abstractmethod
+    def __len__(self: Self) -> NonNegativeInt:
+        """Получить число пар в индексе."""
+
+    @abstractmethod
+    def load(self: Self) -> None:
+        """Считать индекс."""
+
     @abstractmethod
     def from_iterable(
         self: Self,
@@ -25,3 +41,7 @@ class SparseIndex(Protocol):
         distance: NonNegativeInt,
     ) -> None:
         """Построить индекс."""
+
+    @abstractmethod
+    def from_pairs(self: Self, iterable: SortedIterable[tuple[Bytes32, Uint1024]]) -> None:
+        """Построить индекс в памяти."""
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Protocol, Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
-from lsmtree.domain.entities.level import Level
+from lsmtree.domain.entities.table import Table
 from lsmtree.utils.typing import SortedIterable, SortedIterator
 
 
@@ -11,19 +11,19 @@ from lsmtree.utils.typing import SortedIterable, SortedIterator
 class SortedStringTable(Protocol):
     """Интерфейс структуры данных `SSTable`."""
 
-    level: Level
+    table: Table
 
     @abstractmethod
     def get(self: Self, key: Bytes32) -> Bytes32 | None:
         """Получить значение по ключу."""
 
     @abstractmethod
-    def from_iterable(self: Self, iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]]) -> None:
-        """Построить песочную `SSTable`."""
+    def get_many(self: Self, keys: SortedIterable[Bytes32]) -> dict[Bytes32, Bytes32 | None]:
+        """Получить значения по упорядоченным ключам."""
 
     @abstractmethod
-    def over_sandbox(self: Self) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
-        """Получить итератор по таблице из песочницы."""
+    def write(self: Self, iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Записать `SSTable`."""
 
     @abstractmethod
     def __contains__(self: Self, key: Bytes32) -> bool:
@@ -32,3 +32,17 @@ class SortedStringTable(Protocol):
     @abstractmethod
     def __iter__(self: Self) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
         """Получить итератор по таблице."""
+
+    @abstractmethod
+    def seek(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по таблице, начиная от первого ключа не меньше данного."""
+
+    @abstractmethod
+    def seek_reverse(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по таблице, начиная от последнего ключа меньше данного."""
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol, Self
@@ -17,10 +17,22 @@ class WriteAheadLog(Protocol):
     def write(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
         """Записать значение по ключу."""
 
+    @abstractmethod
+    def write_many(self: Self, pairs: Iterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Атомарно записать пакет пар одной записью журнала."""
+
+    @abstractmethod
+    def sync(self: Self) -> None:
+        """Сбросить накопленные записи на диск."""
+
     @abstractmethod
     def clear(self: Self) -> None:
         """Очистить журнал предзаписи."""
 
+    @abstractmethod
+    def close(self: Self) -> None:
+        """Сбросить накопленные записи и закрыть журнал."""
+
     @abstractmethod
     def __iter__(self: Self) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
         """Получить итератор по журналу."""
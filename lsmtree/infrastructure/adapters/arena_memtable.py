@@ -0,0 +1,231 @@
+import struct
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import ClassVar, Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.services.interfaces.memtable import MemTable as Interface
+from lsmtree.domain.services.interfaces.wal import WriteAheadLog
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt
+
+
+# Заголовок записи в арене: длина ключа, длина значения и надгробие
+ENTRY = struct.Struct(">IIB")
+
+# Длина ключа - первое поле заголовка
+LENGTH = struct.Struct(">I")
+
+
+@dataclass
+class ArenaMemTable(Interface):
+    """Компактная реализация структуры данных `MemTable`.
+
+    Примечания:
+        * Ключи и значения дописываются в арену, старые версии остаются в арене до выгрузки;
+        * Порядок ключей хранится в отсортированных подсписках номеров записей;
+        * Объекты ключей создаются лишь на время сравнения;
+        * Размер таблицы - размер арены и индексов, то есть реально занятая память.
+    """
+
+    wal: WriteAheadLog
+
+    # Подсписок делится, когда становится вдвое длиннее этого значения
+    _load: ClassVar[PositiveInt] = 128
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        self._reset()
+
+        for key, value in self.wal:
+            self._put(key, value)
+
+    def put(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
+        """Записать значение по ключу."""
+        self.wal.write(key, value)
+        self._put(key, value)
+
+    def put_many(self: Self, pairs: Iterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Атомарно записать пакет пар.
+
+        Примечания:
+            * Пакет попадает в журнал одной записью и лишь затем применяется к таблице.
+        """
+        pairs = list(pairs)
+        self.wal.write_many(pairs)
+
+        for key, value in pairs:
+            self._put(key, value)
+
+    def get(self: Self, key: Bytes32) -> Bytes32 | None:
+        """Получить значение по ключу."""
+        serial = self._find(key)
+
+        if serial is None:
+            detail = f"The key {key!r} does not exist"
+            raise KeyError(detail)
+
+        _, value = self._get_entry(serial)
+        return value
+
+    def clear(self: Self) -> None:
+        """Очистить таблицу."""
+        self._reset()
+        self.wal.clear()
+
+    @property
+    def size(self: Self) -> NonNegativeInt:
+        """Получить размер таблицы в байтах.
+
+        Примечания:
+            * Учитываются арена, смещения записей и подсписки номеров.
+        """
+        number_of_entries = len(self._offsets)
+        return len(self._arena) + number_of_entries * (self._offsets.itemsize + 4)
+
+    def __contains__(self: Self, key: Bytes32) -> bool:
+        """Проверить наличие ключа."""
+        return self._find(key) is not None
+
+    def __iter__(self: Self) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по упорядоченным парам."""
+        return self.seek()
+
+    def seek(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по упорядоченным парам, начиная от первого ключа не меньше данного."""
+        position, index = (0, 0) if key is None else self._locate(key)
+
+        for serials in self._lists[position:]:
+            for serial in serials[index:]:
+                yield self._get_entry(serial)
+
+            index = 0
+
+    def seek_reverse(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по парам, начиная от последнего ключа меньше данного."""
+        position, index = (len(self._lists), 0) if key is None else self._locate(key)
+
+        if position == len(self._lists):
+            position -= 1
+            index = len(self._lists[position]) if self._lists else 0
+
+        while position >= 0:
+            serials = self._lists[position]
+
+            for serial in reversed(serials[:index]):
+                yield self._get_entry(serial)
+
+            position -= 1
+            index = len(self._lists[position]) if position >= 0 else 0
+
+    def _reset(self: Self) -> None:
+        """Сбросить арену и индексы."""
+        self._arena = bytearray()
+
+        # Смещения последних версий записей в арене по номерам записей
+        self._offsets: array[int] = array("Q")
+
+        # Отсортированные по ключу подсписки номеров и наибольшие ключи подсписков
+        self._lists: list[array[int]] = []
+        self._maxes: list[bytes] = []
+
+    def _put(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
+        """Дописать запись в арену и обновить индексы."""
+        offset = len(self._arena)
+
+        self._arena += ENTRY.pack(len(key), len(value or b""), value is None)
+        self._arena += key
+
+        if value:
+            self._arena += value
+
+        position, index = self._locate(key)
+
+        if position < len(self._lists) and index < len(self._lists[position]):
+            serial = self._lists[position][index]
+
+            if self._get_key(serial) == key:
+                self._offsets[serial] = offset
+                return
+
+        serial = len(self._offsets)
+        self._offsets.append(offset)
+
+        if not self._lists:
+            self._lists.append(array("I", [serial]))
+            self._maxes.append(bytes(key))
+            return
+
+        if position == len(self._lists):
+            position -= 1
+            index = len(self._lists[position])
+
+        serials = self._lists[position]
+        serials.insert(index, serial)
+
+        if index == len(serials) - 1:
+            self._maxes[position] = bytes(key)
+
+        if len(serials) > 2 * self._load:
+            self._lists.insert(position + 1, serials[self._load :])
+            del serials[self._load :]
+
+            self._maxes.insert(position, self._get_key(serials[-1]))
+
+    def _locate(self: Self, key: Bytes32) -> tuple[NonNegativeInt, NonNegativeInt]:
+        """Получить положение первого ключа не меньше данного: номер подсписка и индекс в нем."""
+        position = bisect_left(self._maxes, key)
+
+        if position == len(self._lists):
+            return (position, 0)
+
+        # Ключи арены читаются как `bytes`, поэтому искомый ключ сравнивается как `bytes`
+        probe: bytes = key
+        index = bisect_left(self._lists[position], probe, key=self._get_key)
+        return (position, index)
+
+    def _find(self: Self, key: Bytes32) -> NonNegativeInt | None:
+        """Получить номер записи по ключу или `None`, если ключа нет."""
+        position, index = self._locate(key)
+
+        if position == len(self._lists):
+            return None
+
+        serial = self._lists[position][index]
+        return serial if self._get_key(serial) == key else None
+
+    def _get_key(self: Self, serial: NonNegativeInt) -> bytes:
+        """Получить копию ключа записи по номеру записи.
+
+        Примечания:
+            * Ключ копируется через представление арены, чтобы не копировать срез дважды.
+        """
+        offset = self._offsets[serial]
+        (length,) = LENGTH.unpack_from(self._arena, offset)
+
+        start = offset + ENTRY.size
+
+        with memoryview(self._arena) as view:
+            return bytes(view[start : start + length])
+
+    def _get_entry(self: Self, serial: NonNegativeInt) -> tuple[Bytes32, Bytes32 | None]:
+        """Получить пару 'ключ-значение' по номеру записи."""
+        offset = self._offsets[serial]
+        key_length, value_length, tombstone = ENTRY.unpack_from(self._arena, offset)
+
+        start = offset + ENTRY.size
+        key = Bytes32(self._arena[start : start + key_length])
+
+        if tombstone:
+            return (key, None)
+
+        start += key_length
+        return (key, Bytes32(self._arena[start : start + value_length]))
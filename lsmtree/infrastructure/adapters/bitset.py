@@ -1,21 +1,44 @@
 from dataclasses import dataclass
 from typing import Self
 
-from lsmtree.utils.typing import NonNegativeInt
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt
 
 
 @dataclass
 class BitSet:
-    """Бит-множество."""
+    """Бит-множество фиксированного размера.
 
-    mask: int = 0
+    Примечания:
+        * Может быть построено поверх существующего буфера, например, `mmap`.
+    """
+
+    size: PositiveInt
+    data: bytearray | memoryview | None = None
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        if self.data is None:
+            self.data = bytearray(self.get_number_of_bytes(self.size))
+
+        if len(self.data) != self.get_number_of_bytes(self.size):
+            detail = "The buffer does not match the size of the bit set"
+            raise ValueError(detail)
+
+        self._bytes = self.data
 
     def test(self: Self, bit: NonNegativeInt) -> bool:
         """Проверить, равен ли бит единице."""
-        bitmask = (1 << bit)
-        return (self.mask & bitmask) != 0
+        return (self._bytes[bit >> 3] >> (bit & 7)) & 1 == 1
+
+    def set(self: Self, bit: NonNegativeInt) -> None:
+        """Установить бит в единицу."""
+        self._bytes[bit >> 3] |= 1 << (bit & 7)
 
     def flip(self: Self, bit: NonNegativeInt) -> None:
         """Инвертировать бит."""
-        bitmask = (1 << bit)
-        self.mask ^= bitmask
+        self._bytes[bit >> 3] ^= 1 << (bit & 7)
+
+    @staticmethod
+    def get_number_of_bytes(size: NonNegativeInt) -> NonNegativeInt:
+        """Получить число байт, занимаемых множеством."""
+        return (size + 7) // 8
@@ -0,0 +1,188 @@
+import struct
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass
+from os.path import commonprefix
+from typing import ClassVar, Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt, SortedIterator
+
+
+# Заголовок записи: длина общего префикса, длина суффикса, длина значения и надгробие
+ENTRY = struct.Struct(">HIIB")
+
+# Точки рестарта и их число хранятся в конце блока
+RESTART = struct.Struct(">I")
+
+
+@dataclass
+class BlockBuilder:
+    """Построитель блока `SSTable`.
+
+    Примечания:
+        * Ключ сжимается по префиксу, общему для него и предыдущего ключа;
+        * Каждый `restart_interval` ключ хранится целиком (точка рестарта).
+    """
+
+    restart_interval: PositiveInt = 16
+
+    # Общий префикс ограничен размером поля в заголовке записи
+    _max_shared: ClassVar[NonNegativeInt] = 2 ** 16 - 1
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        self._buffer = bytearray()
+        self._restarts: array[int] = array("I")
+
+        # Предыдущий ключ блока: следующий ключ сжимается по общему префиксу двух ключей
+        self._last_key: bytes = b""
+        self._count: NonNegativeInt = 0
+
+    def add(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
+        """Добавить пару в блок.
+
+        Примечания:
+            * Ключи должны добавляться в порядке возрастания.
+        """
+        shared = 0
+
+        if self._count % self.restart_interval == 0:
+            self._restarts.append(len(self._buffer))
+        else:
+            shared = min(len(commonprefix((self._last_key, key))), self._max_shared)
+
+        self._buffer += ENTRY.pack(shared, len(key) - shared, len(value or b""), value is None)
+        self._buffer += key[shared:]
+
+        if value:
+            self._buffer += value
+
+        self._last_key = key
+        self._count += 1
+
+    def finish(self: Self) -> bytes:
+        """Получить содержимое блока."""
+        restarts = struct.pack(f">{len(self._restarts)}I", *self._restarts)
+        return bytes(self._buffer) + restarts + RESTART.pack(len(self._restarts))
+
+    def reset(self: Self) -> None:
+        """Очистить построитель."""
+        self._buffer = bytearray()
+        self._restarts = array("I")
+        self._last_key = b""
+        self._count = 0
+
+    def is_empty(self: Self) -> bool:
+        """Проверить, пуст ли блок."""
+        return self._count == 0
+
+    @property
+    def size(self: Self) -> NonNegativeInt:
+        """Получить оценку размера блока в байтах."""
+        return len(self._buffer) + RESTART.size * (len(self._restarts) + 1)
+
+
+@dataclass
+class Block:
+    """Блок `SSTable`."""
+
+    data: bytes | memoryview
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        if len(self.data) < RESTART.size:
+            detail = "The block is broken"
+            raise ValueError(detail)
+
+        (number_of_restarts,) = RESTART.unpack_from(self.data, len(self.data) - RESTART.size)
+        self._end = len(self.data) - RESTART.size * (number_of_restarts + 1)
+
+        if self._end < 0:
+            detail = "The block is broken"
+            raise ValueError(detail)
+
+        self._restarts = struct.unpack_from(f">{number_of_restarts}I", self.data, self._end)
+
+    def get(self: Self, key: Bytes32) -> Bytes32 | None:
+        """Получить значение по ключу."""
+        for candidate, value in self.seek(key):
+            if candidate == key:
+                return value
+            break
+
+        detail = f"The key {key!r} does not exist"
+        raise KeyError(detail)
+
+    def seek(self: Self, key: Bytes32) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по парам, начиная от первого ключа не меньше данного."""
+        position = bisect_right(self._restarts, key, key=self._get_restart_key) - 1
+        offset = self._restarts[position] if position >= 0 else 0
+
+        for candidate, value in self._get_iterator(offset):
+            if candidate >= key:
+                yield (candidate, value)
+
+    def seek_reverse(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по парам, начиная от последнего ключа меньше данного.
+
+        Примечания:
+            * Отрезки между точками рестарта разбираются вперед и выдаются в обратном порядке.
+        """
+        position = len(self._restarts)
+
+        if key is not None:
+            position = bisect_left(self._restarts, key, key=self._get_restart_key)
+
+        bounds = [*self._restarts, self._end]
+
+        for serial in range(position - 1, -1, -1):
+            pairs = list(self._get_iterator(bounds[serial], bounds[serial + 1]))
+
+            for candidate, value in reversed(pairs):
+                if key is None or candidate < key:
+                    yield (candidate, value)
+
+    def __iter__(self: Self) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по блоку."""
+        return self._get_iterator(0)
+
+    def __reversed__(self: Self) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по блоку в обратном порядке."""
+        return self.seek_reverse()
+
+    def _get_iterator(
+        self: Self,
+        offset: NonNegativeInt,
+        end: NonNegativeInt | None = None,
+    ) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по блоку, начиная от точки рестарта."""
+        data = self.data
+        last_key = b""
+
+        if end is None:
+            end = self._end
+
+        while offset < end:
+            shared, unshared, length, tombstone = ENTRY.unpack_from(data, offset)
+            offset += ENTRY.size
+
+            key = last_key[:shared] + bytes(data[offset : offset + unshared])
+            offset += unshared
+
+            value = None if tombstone else Bytes32(data[offset : offset + length])
+            offset += length
+
+            last_key = key
+            yield (Bytes32(key), value)
+
+    def _get_restart_key(self: Self, offset: NonNegativeInt) -> Bytes32:
+        """Получить ключ, хранящийся в точке рестарта."""
+        _, unshared, _, _ = ENTRY.unpack_from(self.data, offset)
+        start = offset + ENTRY.size
+        return Bytes32(self.data[start : start + unshared])
@@ -1,70 +1,114 @@
 import hashlib
-import pickle
+import mmap
+import struct
 
 from collections.abc import Iterator
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from io import BufferedReader, BufferedWriter
-from typing import Self
+from typing import ClassVar, Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
-from lsmtree.domain.dtypes.uint32 import Uint32
 from lsmtree.domain.services.interfaces.bloomfilter import BloomFilter as Interface
 from lsmtree.infrastructure.adapters.bitset import BitSet
-from lsmtree.utils.typing import PositiveInt
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt
 
 
 @dataclass
 class BloomFilter(Interface):
-    """Реализация фильтра Блума."""
+    """Реализация фильтра Блума.
+
+    Примечания:
+        * Позиции бит получаются двойным хэшированием (Kirsch-Mitzenmacher).
+    """
 
     number_of_hashes: PositiveInt
+    number_of_bits: PositiveInt
+    seed: NonNegativeInt = 0
+
+    _bitset: BitSet | None = None
+
+    # Заголовок файла: сигнатура, версия, число хэшей, число бит и сид
+    _header: ClassVar[struct.Struct] = struct.Struct(">4sBIQQ")
+    _magic: ClassVar[bytes] = b"LSBF"
+    _version: ClassVar[int] = 1
 
-    _bitset: BitSet = field(default_factory=BitSet)
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        if self._bitset is None:
+            self._bitset = BitSet(self.number_of_bits)
+
+        self._bits = self._bitset
+        self._salt = self.seed.to_bytes(8)
 
     def test(self: Self, data: Bytes32) -> bool:
         """Проверить, может ли объект быть в множестве."""
-        return all(
-            self._bitset.test(self._hash_to_bit(self._hash(data, seed)))
-            for seed in self._get_seed_iterator()
-        )
+        return all(self._bits.test(bit) for bit in self._get_bit_iterator(data))
 
     def add(self: Self, data: Bytes32) -> None:
-        """Добавить объект в фильтр Блума."""
-        for seed in self._get_seed_iterator():
-            hash_ = self._hash(data, seed)
-            bit = self._hash_to_bit(hash_)
+        """Добавить объект в фильтр Блума.
 
-            if not self._bitset.test(bit):
-                self._bitset.flip(bit)
+        Примечания:
+            * Недоступно для фильтров, загруженных из файла.
+        """
+        for bit in self._get_bit_iterator(data):
+            self._bits.set(bit)
 
     def dump(self: Self, buffer: BufferedWriter) -> None:
-        """Сериализовать фильтр Блума.
+        """Сериализовать фильтр Блума."""
+        header = self._header.pack(
+            self._magic,
+            self._version,
+            self.number_of_hashes,
+            self.number_of_bits,
+            self.seed,
+        )
 
-        Примечания:
-            * Требует более безопасной и эффективной реализации.
-        """
-        return pickle.dump(self, buffer)
+        buffer.write(header)
+        buffer.write(self._bits.data or b"")
 
     @staticmethod
     def load(buffer: BufferedReader) -> "BloomFilter":
         """Десериализовать фильтр Блума.
 
         Примечания:
-            * Требует более безопасной и эффективной реализации.
+            * Биты отображаются в память без копирования.
         """
-        return pickle.load(buffer)
+        try:
+            memory = mmap.mmap(buffer.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exception:
+            detail = "The bloom filter file is empty"
+            raise ValueError(detail) from exception
+
+        if len(memory) < BloomFilter._header.size:
+            detail = "The bloom filter header is broken"
+            raise ValueError(detail)
+
+        magic, version, number_of_hashes, number_of_bits, seed = BloomFilter._header.unpack_from(
+            memory,
+        )
 
-    def _get_seed_iterator(self: Self) -> Iterator[int]:
-        """Получить итератор по сидам."""
-        return iter(range(self.number_of_hashes))
+        if magic != BloomFilter._magic or version != BloomFilter._version:
+            detail = "The bloom filter format is not supported"
+            raise ValueError(detail)
 
-    @staticmethod
-    def _hash(data: Bytes32, seed: int) -> int:
-        """Получить хэш объекта."""
-        md5 = hashlib.md5(data, usedforsecurity=False)
-        return int(md5.hexdigest(), base=16) ^ seed
+        start = BloomFilter._header.size
+        stop = start + BitSet.get_number_of_bytes(number_of_bits)
 
-    @staticmethod
-    def _hash_to_bit(hash_: int) -> int:
-        """Отобразить хэш в бит."""
-        return hash_ % (Uint32.max + 1)
+        if len(memory) != stop:
+            detail = "The bloom filter bits are broken"
+            raise ValueError(detail)
+
+        bitset = BitSet(number_of_bits, memoryview(memory)[start:stop])
+        return BloomFilter(number_of_hashes, number_of_bits, seed, bitset)
+
+    def _get_bit_iterator(self: Self, data: Bytes32) -> Iterator[int]:
+        """Получить итератор по битам объекта."""
+        lower, upper = self._hash(data)
+
+        for seed in range(self.number_of_hashes):
+            yield (lower + seed * upper) % self.number_of_bits
+
+    def _hash(self: Self, data: Bytes32) -> tuple[int, int]:
+        """Получить пару 64-битных хэшей объекта."""
+        digest = hashlib.blake2b(data, digest_size=16, salt=self._salt).digest()
+        return int.from_bytes(digest[:8]), int.from_bytes(digest[8:])
@@ -0,0 +1,151 @@
+import threading
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Self
+
+from lsmtree.domain.services.interfaces.compaction_scheduler import (
+    CompactionScheduler as Interface,
+)
+from lsmtree.domain.services.interfaces.compaction_strategy import CompactionStrategy
+from lsmtree.domain.services.interfaces.manifest import Manifest
+from lsmtree.utils.typing import PositiveInt
+
+
+@dataclass
+class CompactionScheduler(Interface):
+    """Реализация планировщика компакции.
+
+    Примечания:
+        * Компакция идет в фоновом потоке, не в потоке записи;
+        * Задача выбирается по давлению уровня, которое считает стратегия компакции;
+        * Уровни задачи резервируются, чтобы выгрузка и компакция не меняли их одновременно;
+        * Выгрузка ждет, пока стратегия компакции считает первый уровень переполненным;
+        * Ошибка фоновой компакции пробрасывается из выгрузки и закрытия планировщика.
+    """
+
+    manifest: Manifest
+    strategy: CompactionStrategy
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        # Защищает резервирования и будит ожидающих при их изменении
+        self._condition = threading.Condition()
+        self._reserved: set[PositiveInt] = set()
+        self._closed = False
+
+        # Ошибка, на которой остановилась фоновая компакция
+        self._error: Exception | None = None
+
+        self._worker = threading.Thread(target=self._compact_periodically, daemon=True)
+        self._worker.start()
+
+    @contextmanager
+    def reserve_first_level(self: Self) -> Iterator[PositiveInt]:
+        """Зарезервировать первый уровень под выгрузку `MemTable` и получить номер уровня.
+
+        Примечания:
+            * Если первый уровень занят компакцией или слишком велик, выгрузка ждет;
+            * Если фоновая компакция завершилась ошибкой, выгрузка пробрасывает эту ошибку.
+        """
+        serial = 1
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._can_flush(serial))
+            self._raise_error()
+
+            self._reserved.add(serial)
+
+        try:
+            yield serial
+        finally:
+            self._release(serial)
+
+    def close(self: Self) -> None:
+        """Дождаться текущей задачи и остановить компакцию.
+
+        Примечания:
+            * Если фоновая компакция завершилась ошибкой, закрытие пробрасывает эту ошибку.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        self._worker.join()
+        self._raise_error()
+
+    def _can_flush(self: Self, serial: PositiveInt) -> bool:
+        """Проверить, можно ли выгрузить `MemTable` на первый уровень."""
+        if serial in self._reserved:
+            return False
+
+        return self._closed or not self.strategy.must_stall(serial)
+
+    def _compact_periodically(self: Self) -> None:
+        """Выполнять задачи компакции, пока планировщик не остановлен.
+
+        Примечания:
+            * Если задача завершилась ошибкой, компакция останавливается и ошибка сохраняется.
+        """
+        try:
+            while (serial := self._acquire()) is not None:
+                try:
+                    self.strategy.compact(serial)
+                finally:
+                    self._release(serial, serial + 1)
+        except Exception as error:
+            with self._condition:
+                self._error = error
+
+            raise
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+
+    def _raise_error(self: Self) -> None:
+        """Пробросить ошибку, на которой остановилась фоновая компакция."""
+        if self._error is not None:
+            detail = "The background compaction has failed"
+            raise RuntimeError(detail) from self._error
+
+    def _acquire(self: Self) -> PositiveInt | None:
+        """Дождаться задачи компакции и зарезервировать уровни задачи.
+
+        Примечания:
+            * После остановки планировщика возвращается `None`.
+        """
+        with self._condition:
+            while not self._closed:
+                serial = self._pick()
+
+                if serial is not None:
+                    self._reserved.update((serial, serial + 1))
+                    return serial
+
+                self._condition.wait()
+
+        return None
+
+    def _release(self: Self, *serials: PositiveInt) -> None:
+        """Снять резервирование уровней и разбудить ожидающих."""
+        with self._condition:
+            self._reserved.difference_update(serials)
+            self._condition.notify_all()
+
+    def _pick(self: Self) -> PositiveInt | None:
+        """Выбрать уровень, давление которого наибольшее и не меньше единицы."""
+        candidate: PositiveInt | None = None
+        candidate_pressure = 0.0
+
+        for serial, _ in self.manifest:
+            if serial in self._reserved or serial + 1 in self._reserved:
+                continue
+
+            pressure = self.strategy.get_pressure(serial)
+
+            if pressure >= 1 and pressure > candidate_pressure:
+                candidate, candidate_pressure = serial, pressure
+
+        return candidate
@@ -0,0 +1,51 @@
+import bz2
+import lzma
+import zlib
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import ClassVar, Self
+
+from lsmtree.domain.dtypes.compression import Compression
+
+
+@dataclass
+class Compressor:
+    """Оператор сжатия блоков."""
+
+    compression: Compression
+
+    _compressors: ClassVar[dict[Compression, Callable[[bytes], bytes]]] = {
+        Compression.NONE: bytes,
+        Compression.ZLIB: zlib.compress,
+        Compression.BZ2: bz2.compress,
+        Compression.LZMA: lzma.compress,
+    }
+
+    _decompressors: ClassVar[dict[Compression, Callable[[bytes], bytes]]] = {
+        Compression.NONE: bytes,
+        Compression.ZLIB: zlib.decompress,
+        Compression.BZ2: bz2.decompress,
+        Compression.LZMA: lzma.decompress,
+    }
+
+    def compress(self: Self, data: bytes) -> tuple[Compression, bytes]:
+        """Сжать данные.
+
+        Примечания:
+            * Если сжатие не дает выигрыша, данные остаются несжатыми.
+        """
+        if self.compression == Compression.NONE:
+            return (Compression.NONE, data)
+
+        compressed = self._compressors[self.compression](data)
+
+        if len(compressed) >= len(data):
+            return (Compression.NONE, data)
+
+        return (self.compression, compressed)
+
+    @staticmethod
+    def decompress(compression: Compression, data: bytes) -> bytes:
+        """Распаковать данные."""
+        return Compressor._decompressors[compression](data)
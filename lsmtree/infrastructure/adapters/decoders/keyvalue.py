@@ -0,0 +1,102 @@
+import struct
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.services.interfaces.decoder import Decoder as Interface
+from lsmtree.utils.typing import NonNegativeInt
+
+
+# Длина ключа или значения
+LENGTH = struct.Struct(">I")
+
+
+def decode_record(
+    data: memoryview,
+    offset: NonNegativeInt,
+) -> tuple[memoryview, memoryview | None, NonNegativeInt] | None:
+    """Разобрать запись по смещению и получить ключ, значение и смещение конца записи.
+
+    Примечания:
+        * Возвращает `None`, если запись оборвана или данные закончились.
+    """
+    size = len(data)
+    start = offset + LENGTH.size
+
+    if start > size:
+        return None
+
+    (length,) = LENGTH.unpack_from(data, offset)
+    stop = start + length
+
+    if stop >= size:
+        return None
+
+    key = data[start:stop]
+    position = stop + 1
+
+    if data[stop]:
+        return (key, None, position)
+
+    if position + LENGTH.size > size:
+        return None
+
+    (length,) = LENGTH.unpack_from(data, position)
+    position += LENGTH.size
+
+    if position + length > size:
+        return None
+
+    return (key, data[position : position + length], position + length)
+
+
+@dataclass
+class Decoder(Interface[tuple[Bytes32, Bytes32 | None]]):
+    """Оператор пакетного разбора пар 'ключ-значение'.
+
+    Примечания:
+        * Запись - 4-байтная длина ключа, ключ и байт надгробия;
+        * После живого ключа идут 4-байтная длина значения и само значение;
+        * Разбор идет одним проходом по `memoryview` без промежуточных буфферов;
+        * Оборванная последняя запись не выдается, смещение указывает на начало этой записи.
+    """
+
+    data: bytes | memoryview
+
+    _offset: NonNegativeInt = 0
+    _is_broken_flag: bool = False
+
+    def __iter__(self: Self) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по парам."""
+        for key, value, _ in self.records():
+            yield (Bytes32(key), None if value is None else Bytes32(value))
+
+    def records(self: Self) -> Iterator[tuple[memoryview, memoryview | None, NonNegativeInt]]:
+        """Получить итератор по записям в виде срезов и смещений их начала.
+
+        Примечания:
+            * Срезы ссылаются на исходные данные и материализуются вызывающим кодом.
+        """
+        data = memoryview(self.data)
+        offset = self._offset
+
+        while (record := decode_record(data, offset)) is not None:
+            key, value, position = record
+
+            self._offset = position
+            yield (key, value, offset)
+
+            offset = position
+
+        self._is_broken_flag = offset < len(data)
+
+    def is_broken(self: Self) -> bool:
+        """Проверить, оборвана ли последняя запись."""
+        return self._is_broken_flag
+
+    @property
+    def offset(self: Self) -> NonNegativeInt:
+        """Получить смещение конца последней разобранной записи."""
+        return self._offset
@@ -0,0 +1,72 @@
+import struct
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import BinaryIO, Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.dtypes.uint1024 import Uint1024
+from lsmtree.domain.services.interfaces.encoder import Encoder as Interface
+from lsmtree.utils.typing import PositiveInt
+
+
+# Длина ключа
+LENGTH = struct.Struct(">I")
+
+# Смещение
+OFFSET = struct.Struct(">Q")
+
+
+@dataclass
+class Encoder(Interface[tuple[Bytes32, Uint1024]]):
+    """Оператор пакетной записи пар 'ключ-смещение'.
+
+    Примечания:
+        * Запись - 4-байтная длина ключа, ключ и 8-байтное смещение;
+        * Записи упаковываются в переиспользуемый блок и попадают в буффер целыми блоками;
+        * Последний неполный блок попадает в буффер только после `flush`.
+    """
+
+    buffer: BinaryIO
+    chunk_size: PositiveInt = 64 * 1024  # 64 KiB
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        self._chunk = bytearray(self.chunk_size)
+        self._position = 0
+
+    def write(self: Self, data: tuple[Bytes32, Uint1024]) -> None:
+        """Упаковать пару в блок."""
+        key, offset = data
+        size = LENGTH.size + len(key) + OFFSET.size
+
+        if self._position + size > len(self._chunk):
+            self.flush()
+
+        if size > len(self._chunk):
+            self._chunk = bytearray(size)
+
+        chunk = self._chunk
+        position = self._position
+
+        LENGTH.pack_into(chunk, position, len(key))
+        position += LENGTH.size
+
+        chunk[position : position + len(key)] = key
+        position += len(key)
+
+        OFFSET.pack_into(chunk, position, offset)
+        position += OFFSET.size
+
+        self._position = position
+
+    def write_many(self: Self, iterable: Iterable[tuple[Bytes32, Uint1024]]) -> None:
+        """Упаковать пары в блок, записывая заполненные блоки в буффер."""
+        for pair in iterable:
+            self.write(pair)
+
+    def flush(self: Self) -> None:
+        """Записать упакованный блок в буффер."""
+        if self._position:
+            self.buffer.write(memoryview(self._chunk)[: self._position])
+            self._position = 0
@@ -0,0 +1,81 @@
+import struct
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import BinaryIO, Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.services.interfaces.encoder import Encoder as Interface
+from lsmtree.utils.typing import PositiveInt
+
+
+# Длина ключа или значения
+LENGTH = struct.Struct(">I")
+
+
+@dataclass
+class Encoder(Interface[tuple[Bytes32, Bytes32 | None]]):
+    """Оператор пакетной записи пар 'ключ-значение'.
+
+    Примечания:
+        * Запись - 4-байтная длина ключа, ключ и байт надгробия;
+        * После живого ключа идут 4-байтная длина значения и само значение;
+        * Записи упаковываются в переиспользуемый блок и попадают в буффер целыми блоками;
+        * Последний неполный блок попадает в буффер только после `flush`.
+    """
+
+    buffer: BinaryIO
+    chunk_size: PositiveInt = 64 * 1024  # 64 KiB
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        self._chunk = bytearray(self.chunk_size)
+        self._position = 0
+
+    def write(self: Self, data: tuple[Bytes32, Bytes32 | None]) -> None:
+        """Упаковать пару в блок."""
+        key, value = data
+
+        width = LENGTH.size
+        key_length = len(key)
+        value_length = 0 if value is None else len(value)
+
+        size = width + key_length + 1 + (0 if value is None else width + value_length)
+
+        if self._position + size > len(self._chunk):
+            self.flush()
+
+        if size > len(self._chunk):
+            self._chunk = bytearray(size)
+
+        chunk = self._chunk
+        position = self._position
+
+        LENGTH.pack_into(chunk, position, key_length)
+        position += width
+
+        chunk[position : position + key_length] = key
+        position += key_length
+
+        chunk[position] = value is None
+        position += 1
+
+        if value is not None:
+            LENGTH.pack_into(chunk, position, value_length)
+            position += width
+
+            chunk[position : position + value_length] = value
+            position += value_length
+
+        self._position = position
+
+    def write_many(self: Self, iterable: Iterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Упаковать пары в блок, записывая заполненные блоки в буффер."""
+        for pair in iterable:
+            self.write(pair)
+
+    def flush(self: Self) -> None:
+        """Записать упакованный блок в буффер."""
+        if self._position:
+            self.buffer.write(memoryview(self._chunk)[: self._position])
+            self._position = 0
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.services.interfaces.compaction_strategy import (
+    CompactionStrategy as Interface,
+)
+from lsmtree.domain.services.interfaces.manifest import Manifest
+from lsmtree.domain.services.interfaces.merger import Merger
+from lsmtree.utils.typing import PositiveInt, SortedIterable
+
+
+@dataclass
+class LeveledCompaction(Interface):
+    """Реализация выравнивающей компакции.
+
+    Примечания:
+        * Целевой размер уровня растет в `size_ratio` раз на уровень;
+        * Выгрузка добавляет новый прогон первого уровня, не переписывая старые;
+        * Компакция первого уровня сливает все прогоны уровня и пересекающие их таблицы второго;
+        * Более глубокий уровень - один прогон: компакция переносит одну таблицу уровня
+          в таблицы следующего уровня, которые она пересекает;
+        * Ключ встречается не более раза на уровне глубже первого, но переписывается на каждом;
+        * Выгрузка ждет компакции, пока уровень не меньше `stall_size`.
+    """
+
+    manifest: Manifest
+    merger: Merger
+
+    # Целевой размер первого уровня [в байтах]
+    base_size: PositiveInt = 4 * 1024 * 1024  # 4 MiB
+
+    # Отношение целевого размера уровня к целевому размеру предыдущего
+    size_ratio: PositiveInt = 4
+
+    # Размер уровня, при котором выгрузка ждет компакции [в байтах]
+    # Примечание: не меньше `base_size`, иначе выгрузка ждет уровень, который не компактится
+    stall_size: PositiveInt = 16 * 1024 * 1024  # 16 MiB
+
+    def flush(
+        self: Self,
+        serial: PositiveInt,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+    ) -> None:
+        """Выгрузить пары `MemTable` новым прогоном уровня."""
+        self.merger.add_run(serial, iterable)
+
+    def get_pressure(self: Self, serial: PositiveInt) -> float:
+        """Получить давление уровня: отношение размера уровня к целевому."""
+        return self.manifest.get_size(serial) / (self.base_size * self.size_ratio ** (serial - 1))
+
+    def must_stall(self: Self, serial: PositiveInt) -> bool:
+        """Проверить, не меньше ли размер уровня `stall_size`."""
+        return self.manifest.get_size(serial) >= self.stall_size
+
+    def compact(self: Self, serial: PositiveInt) -> None:
+        """Слить прогоны первого уровня или перенести одну таблицу уровня на следующий уровень."""
+        if serial == 1:
+            self.merger.merge_runs_down(serial)
+            return
+
+        self.merger.merge_down(serial)
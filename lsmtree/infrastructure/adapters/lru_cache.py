@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Self, TypeVar
+
+from lsmtree.domain.entities.cache_info import CacheInfo
+from lsmtree.domain.services.interfaces.cache import Cache as Interface
+from lsmtree.utils.typing import NonNegativeInt
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class LRUCache(Interface[K, V]):
+    """Кэш, вытесняющий давно не использованные значения.
+
+    Примечания:
+        * Значения, превышающие емкость кэша, не кэшируются.
+    """
+
+    capacity: NonNegativeInt
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        self._items: OrderedDict[K, tuple[V, NonNegativeInt]] = OrderedDict()
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+
+    def get(self: Self, key: K) -> V | None:
+        """Получить значение по ключу, если оно закэшировано."""
+        item = self._items.get(key)
+
+        if item is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._items.move_to_end(key)
+
+        value, _ = item
+        return value
+
+    def put(self: Self, key: K, value: V, size: NonNegativeInt) -> None:
+        """Закэшировать значение по ключу."""
+        self.pop(key)
+
+        if size > self.capacity:
+            return
+
+        self._items[key] = (value, size)
+        self._size += size
+
+        while self._size > self.capacity:
+            _, (_, evicted_size) = self._items.popitem(last=False)
+            self._size -= evicted_size
+
+    def pop(self: Self, key: K) -> V | None:
+        """Удалить значение по ключу из кэша и получить удаленное значение."""
+        item = self._items.pop(key, None)
+
+        if item is None:
+            return None
+
+        value, size = item
+        self._size -= size
+
+        return value
+
+    def clear(self: Self) -> None:
+        """Очистить кэш."""
+        self._items.clear()
+        self._size = 0
+
+    def cache_info(self: Self) -> CacheInfo:
+        """Получить статистику кэша."""
+        return CacheInfo(self._hits, self._misses, self.capacity, self._size)
@@ -0,0 +1,170 @@
+import itertools
+import json
+import os
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.entities.run import Run
+from lsmtree.domain.entities.storage import Storage
+from lsmtree.domain.entities.table import Table
+from lsmtree.domain.entities.table_info import TableInfo
+from lsmtree.domain.services.interfaces.manifest import Manifest as Interface
+from lsmtree.utils.filesystem import fsync_directory
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt, SortedIterator
+
+
+@dataclass
+class Manifest(Interface):
+    """Реализация манифеста.
+
+    Примечания:
+        * Только манифест знает, какие таблицы лежат на уровнях;
+        * Уровень - прогоны от новых к старым, прогон - таблицы, диапазоны которых не пересекаются;
+        * Новая версия пишется целиком и подменяет старую переименованием;
+        * Таблицы, которых нет в манифесте, остаются от прерванных слияний.
+    """
+
+    storage: Storage
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        self._levels: dict[PositiveInt, list[Run]] = {}
+
+        if self.storage.manifest.exists():
+            self._levels = self._load()
+
+        # Номера выдаются после всех таблиц на диске, включая еще не удаленные остатки
+        start = max(self.storage.get_serials(), default=0) + 1
+        self._serials: Iterator[PositiveInt] = itertools.count(start)
+
+    def get_level(self: Self, serial: PositiveInt) -> list[Run]:
+        """Получить прогоны уровня от новых к старым."""
+        return self._levels.get(serial, [])
+
+    def get_size(self: Self, serial: PositiveInt) -> NonNegativeInt:
+        """Получить суммарный размер таблиц уровня."""
+        return sum(run.size for run in self.get_level(serial))
+
+    def create_table(self: Self) -> Table:
+        """Создать таблицу под новым номером."""
+        return self.storage.get_table(next(self._serials))
+
+    def apply(
+        self: Self,
+        removed: Iterable[TableInfo],
+        added: Mapping[PositiveInt, Iterable[TableInfo]],
+        *,
+        separate: bool = False,
+    ) -> None:
+        """Атомарно убрать и добавить таблицы.
+
+        Примечания:
+            * Добавленные таблицы дополняют самый новый прогон уровня, не пересекая таблиц прогона;
+            * При `separate=True` добавленные таблицы образуют новый, самый новый прогон уровня;
+            * Читатели, получившие список прогонов уровня ранее, продолжают видеть старую версию.
+        """
+        paths = {info.table.path for info in removed}
+
+        levels = {
+            serial: [[info for info in run.infos if info.table.path not in paths] for run in runs]
+            for serial, runs in self._levels.items()
+        }
+
+        for serial, infos in added.items():
+            runs = levels.setdefault(serial, [])
+
+            if separate or not runs:
+                runs.insert(0, list(infos))
+            else:
+                runs[0].extend(infos)
+
+        levels = {
+            serial: [sorted(infos, key=attrgetter("smallest")) for infos in runs if infos]
+            for serial, runs in levels.items()
+        }
+
+        levels = {serial: runs for serial, runs in levels.items() if runs}
+        self._dump(levels)
+
+        self._levels = {
+            serial: [Run(tuple(infos)) for infos in runs] for serial, runs in levels.items()
+        }
+
+    def collect_garbage(self: Self) -> None:
+        """Удалить таблицы, которых нет в манифесте."""
+        paths = {info.table.path for _, runs in self for run in runs for info in run.infos}
+
+        for serial in self.storage.get_serials():
+            table = self.storage.get_table(serial)
+
+            if table.path not in paths:
+                table.delete()
+
+    def __contains__(self: Self, table: Table) -> bool:
+        """Проверить, учтена ли таблица в манифесте."""
+        return any(
+            info.table.path == table.path for _, runs in self for run in runs for info in run.infos
+        )
+
+    def __iter__(self: Self) -> SortedIterator[tuple[PositiveInt, list[Run]]]:
+        """Получить итератор по заполненным уровням."""
+        levels = self._levels
+
+        for serial in sorted(levels):
+            yield (serial, levels[serial])
+
+    def _load(self: Self) -> dict[PositiveInt, list[Run]]:
+        """Считать манифест."""
+        with self.storage.manifest.open(mode="rb") as buffer:
+            try:
+                document = json.load(buffer)
+            except ValueError as exception:
+                detail = "The manifest is broken"
+                raise ValueError(detail) from exception
+
+        levels: dict[PositiveInt, list[Run]] = {}
+
+        for serial, runs in document["levels"].items():
+            levels[int(serial)] = [Run(tuple(self._decode(item) for item in run)) for run in runs]
+
+        return levels
+
+    def _dump(self: Self, levels: Mapping[PositiveInt, list[list[TableInfo]]]) -> None:
+        """Записать манифест."""
+        document = {
+            "levels": {
+                str(serial): [[self._encode(info) for info in infos] for infos in runs]
+                for serial, runs in levels.items()
+            },
+        }
+
+        with self.storage.manifest_sandbox.open(mode="w") as buffer:
+            json.dump(document, buffer)
+
+            buffer.flush()
+            os.fsync(buffer.fileno())
+
+        self.storage.manifest_sandbox.replace(self.storage.manifest)
+        fsync_directory(self.storage.root)
+
+    def _encode(self: Self, info: TableInfo) -> dict[str, Any]:
+        """Представить сведения про таблицу в виде документа."""
+        return {
+            "path": info.table.path.relative_to(self.storage.root).as_posix(),
+            "smallest": info.smallest.hex(),
+            "largest": info.largest.hex(),
+            "size": info.size,
+        }
+
+    def _decode(self: Self, item: dict[str, Any]) -> TableInfo:
+        """Получить сведения про таблицу из документа."""
+        return TableInfo(
+            table=Table(self.storage.root / item["path"]),
+            smallest=Bytes32(bytes.fromhex(item["smallest"])),
+            largest=Bytes32(bytes.fromhex(item["largest"])),
+            size=item["size"],
+        )
@@ -1,4 +1,4 @@
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from sys import getsizeof
 from typing import Self
@@ -19,15 +19,29 @@ class MemTable(Interface):
 
     _sorted_dict: SortedDict[Bytes32, Bytes32 | None] = field(default_factory=SortedDict)
 
+    _size: NonNegativeInt = 0
+
     def __post_init__(self: Self) -> None:
         """Дополнительная инициализация объекта."""
         for key, value in self.wal:
-            self._sorted_dict[key] = value
+            self._put(key, value)
 
     def put(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
         """Записать значение по ключу."""
         self.wal.write(key, value)
-        self._sorted_dict[key] = value
+        self._put(key, value)
+
+    def put_many(self: Self, pairs: Iterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Атомарно записать пакет пар.
+
+        Примечания:
+            * Пакет попадает в журнал одной записью и лишь затем применяется к таблице.
+        """
+        pairs = list(pairs)
+        self.wal.write_many(pairs)
+
+        for key, value in pairs:
+            self._put(key, value)
 
     def get(self: Self, key: Bytes32) -> Bytes32 | None:
         """Получить значение по ключу."""
@@ -36,12 +50,28 @@ class MemTable(Interface):
     def clear(self: Self) -> None:
         """Очистить таблицу."""
         self._sorted_dict.clear()
+        self._size = 0
+
         self.wal.clear()
 
     @property
     def size(self: Self) -> NonNegativeInt:
-        """Получить размер таблицы в байтах."""
-        return sum(getsizeof(key) + getsizeof(value) for key, value in self._sorted_dict.items())
+        """Получить размер таблицы в байтах.
+
+        Примечания:
+            * Размер поддерживается при каждой записи, поэтому не требует обхода таблицы.
+        """
+        return self._size
+
+    def _put(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
+        """Записать значение по ключу в память, пересчитав размер таблицы."""
+        if key in self._sorted_dict:
+            self._size -= getsizeof(self._sorted_dict[key])
+        else:
+            self._size += getsizeof(key)
+
+        self._sorted_dict[key] = value
+        self._size += getsizeof(value)
 
     def __contains__(self: Self, key: Bytes32) -> bool:
         """Проверить наличие ключа."""
@@ -50,3 +80,21 @@ class MemTable(Interface):
     def __iter__(self: Self) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
         """Получить итератор по упорядоченным парам."""
         return iter(self._sorted_dict.items())
+
+    def seek(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по упорядоченным парам, начиная от первого ключа не меньше данного."""
+        for candidate in self._sorted_dict.irange(minimum=key):
+            yield (candidate, self._sorted_dict[candidate])
+
+    def seek_reverse(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по парам, начиная от последнего ключа меньше данного."""
+        iterator = self._sorted_dict.irange(maximum=key, inclusive=(True, False), reverse=True)
+
+        for candidate in iterator:
+            yield (candidate, self._sorted_dict[candidate])
@@ -1,86 +1,359 @@
-from typing import Self
+import itertools
+
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.entities.compaction_info import CompactionInfo
 from lsmtree.domain.entities.level import Level
+from lsmtree.domain.entities.run import Run
+from lsmtree.domain.entities.table import Table
+from lsmtree.domain.entities.table_info import TableInfo
+from lsmtree.domain.services.interfaces.manifest import Manifest
 from lsmtree.domain.services.interfaces.merger import Merger as Interface
 from lsmtree.infrastructure.adapters.sstable import SortedStringTable
-from lsmtree.utils.typing import SortedIterator
+from lsmtree.utils.filesystem import fsync_directory
+from lsmtree.utils.itertools import merged
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt, SortedIterable, SortedIterator
 
 
+@dataclass
 class Merger(Interface):
-    """Реализация оператора слияния."""
+    """Реализация оператора слияния.
+
+    Примечания:
+        * Уровень - прогоны манифеста, прогон - таблицы, диапазоны ключей которых не пересекаются;
+        * Слияние переписывает лишь таблицы, пересекающие входные данные, не весь уровень;
+        * Новый прогон, напротив, не переписывает ничего, но добавляет источник для чтения;
+        * Результат делится на таблицы размера `table_size` и публикуется в манифесте под `lock`;
+        * Надгробия отбрасываются, если под результатом слияния нет более старых версий ключа;
+        * Удаление таблицы передается в `on_replace`.
+    """
+
+    manifest: Manifest
+    sstable_factory: Callable[[Table, PositiveInt], SortedStringTable]
+    on_replace: Callable[[Table], None] | None = None
+
+    # Блокировка, под которой публикуются результаты: читатели не видят промежуточных состояний
+    lock: AbstractContextManager[Any] = field(default_factory=nullcontext)
+
+    # Размер данных таблицы, по достижении которого начинается следующая [в байтах]
+    table_size: PositiveInt = 2 * 1024 * 1024  # 2 MiB
+
+    def __post_init__(self: Self) -> None:
+        """Дополнительная инициализация объекта."""
+        # Наибольший ключ последней перенесенной таблицы уровня: перенос идет по кругу
+        self._pointers: dict[PositiveInt, Bytes32] = {}
+
+        self._stats = CompactionInfo(tombstones_dropped=0, bytes_reclaimed=0)
 
     def merge(self: Self, level: Level) -> None:
-        """Выполнить операцию слияния."""
-        if level.is_merged():
-            level.clear()
+        """Перевести уровень устаревшего формата в манифест.
+
+        Примечания:
+            * Смердженный уровень очищается: данные уровня уже лежат на следующем уровне;
+            * Песочница отбрасывается: эти данные еще лежат на предыдущем уровне или в журнале;
+            * Таблица уровня становится единственной таблицей уровня под тем же номером.
+        """
+        level.clear()
+        level.untrust_sandbox()
 
-        if not level.has_trusted_sandbox():
+        if level.is_empty() or level in self.manifest:
             return
 
-        if level.is_empty():
-            level.untrust_bloom_filter()
-            level.untrust_sparse_index()
+        sstable = self.sstable_factory(level, level.serial)
+        first = next(iter(sstable), None)
 
-            level.sandbox.rename(level.sstable)
-            level.untrust_sandbox()
+        if first is None:
+            level.delete()
+            return
+
+        smallest, _ = first
+        largest, _ = next(sstable.seek_reverse())
+
+        info = TableInfo(level, smallest, largest, level.sstable.stat().st_size)
+        self._publish([], {level.serial: [info]})
+
+    def merge_down(self: Self, serial: PositiveInt) -> None:
+        """Перенести одну таблицу уровня на следующий уровень.
 
+        Примечания:
+            * Таблица берется из самого старого прогона: более новые прогоны перекрывают таблицу;
+            * Таблицы выбираются по кругу, чтобы перенос равномерно покрывал ключи;
+            * Таблица без пересечений на следующем уровне переносится без перезаписи.
+        """
+        info = self._pick(serial)
+
+        if info is None:
             return
 
-        sstable = SortedStringTable(level.next)
-        iterable = self._get_iterator(level)
-        sstable.from_iterable(iterable)
+        self._pointers[serial] = info.largest
 
-        self.merge(level.next)
-        level.mark_as_merged()
+        run = self._get_newest_run(serial + 1)
+        overlapping = run.get_overlapping(info.smallest, info.largest)
 
-        level.clear()
+        if not overlapping:
+            self._publish([info], {serial + 1: [info]})
+            return
+
+        older = self._get_older_runs(serial + 1, skip=1)
+
+        sources = [self._chain(serial, [info]), self._chain(serial + 1, overlapping)]
+        added, stats = self._rewrite(serial + 1, sources, older)
+
+        self._publish([info, *overlapping], {serial + 1: added}, stats=stats)
+
+    def add_run(
+        self: Self,
+        serial: PositiveInt,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+    ) -> None:
+        """Записать пары новым прогоном уровня.
+
+        Примечания:
+            * Таблицы уровня не перезаписываются: новый прогон перекрывает старые при чтении.
+        """
+        added, stats = self._rewrite(serial, [iterable], self._get_older_runs(serial))
+        self._publish([], {serial: added}, stats=stats, separate=True)
+
+    def merge_runs(self: Self, serial: PositiveInt) -> None:
+        """Слить все прогоны уровня в новый прогон следующего уровня.
+
+        Примечания:
+            * Прогоны следующего уровня не перезаписываются: новый прогон становится самым новым;
+            * При равных ключах побеждают пары из более новых прогонов.
+        """
+        runs = self.manifest.get_level(serial)
+
+        if not runs:
+            return
+
+        sources = [self._chain(serial, run.infos) for run in runs]
+        added, stats = self._rewrite(serial + 1, sources, self._get_older_runs(serial + 1))
+
+        removed = [info for run in runs for info in run.infos]
+        self._publish(removed, {serial + 1: added}, stats=stats, separate=True)
+
+    def merge_runs_down(self: Self, serial: PositiveInt) -> None:
+        """Слить все прогоны уровня и пересекающие их таблицы следующего уровня.
+
+        Примечания:
+            * Переписываются лишь таблицы следующего уровня, пересекающие диапазон ключей уровня;
+            * При равных ключах побеждают пары из более новых прогонов.
+        """
+        runs = self.manifest.get_level(serial)
+
+        if not runs:
+            return
+
+        smallest = min(run.infos[0].smallest for run in runs)
+        largest = max(run.infos[-1].largest for run in runs)
+
+        overlapping = self._get_newest_run(serial + 1).get_overlapping(smallest, largest)
+        older = self._get_older_runs(serial + 1, skip=1)
+
+        sources = [self._chain(serial, run.infos) for run in runs]
+        sources.append(self._chain(serial + 1, overlapping))
+        added, stats = self._rewrite(serial + 1, sources, older)
 
-    def _get_iterator(self: Self, level: Level) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
-        """Получить итератор по объединенным `SSTable`."""
-        iterator_factory = SortedStringTable(level)
+        removed = [info for run in runs for info in run.infos]
+        self._publish([*removed, *overlapping], {serial + 1: added}, stats=stats)
 
-        sandbox_iterator = iterator_factory.over_sandbox()
-        sstable_iterator = iter(iterator_factory)
+    def compaction_info(self: Self) -> CompactionInfo:
+        """Получить статистику слияний."""
+        return self._stats
 
-        sandbox_pair: tuple[Bytes32, Bytes32 | None] | None = None
-        sstable_pair: tuple[Bytes32, Bytes32 | None] | None = None
+    def _get_newest_run(self: Self, serial: PositiveInt) -> Run:
+        """Получить самый новый прогон уровня или пустой прогон."""
+        runs = self.manifest.get_level(serial)
+        return runs[0] if runs else Run()
 
-        while True:
-            if sandbox_pair is None:
-                try:
-                    sandbox_key, sandbox_value = next(sandbox_iterator)
-                    sandbox_pair = sandbox_key, sandbox_value
-                except StopIteration:
-                    pass
+    def _get_older_runs(self: Self, serial: PositiveInt, skip: NonNegativeInt = 0) -> list[Run]:
+        """Получить прогоны старше результата слияния на уровень.
 
-            if sstable_pair is None:
-                try:
-                    sstable_key, sstable_value = next(sstable_iterator)
-                    sstable_pair = sstable_key, sstable_value
-                except StopIteration:
-                    pass
+        Примечания:
+            * Из прогонов самого уровня пропускаются `skip` самых новых;
+            * Прогоны более глубоких уровней старше результата.
+        """
+        older: list[Run] = []
 
-            if sandbox_pair is None or sstable_pair is None:
+        for current, runs in self.manifest:
+            if current == serial:
+                older.extend(runs[skip:])
+
+            if current > serial:
+                older.extend(runs)
+
+        return older
+
+    def _pick(self: Self, serial: PositiveInt) -> TableInfo | None:
+        """Выбрать таблицу самого старого прогона, следующую за перенесенной в прошлый раз."""
+        runs = self.manifest.get_level(serial)
+
+        if not runs:
+            return None
+
+        infos = runs[-1].infos
+        pointer = self._pointers.get(serial)
+
+        if pointer is not None:
+            position = bisect_right(infos, pointer, key=attrgetter("smallest"))
+
+            if position < len(infos):
+                return infos[position]
+
+        return infos[0]
+
+    def _chain(
+        self: Self,
+        serial: PositiveInt,
+        infos: Iterable[TableInfo],
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по упорядоченным таблицам уровня подряд."""
+        for info in infos:
+            yield from self.sstable_factory(info.table, serial)
+
+    def _rewrite(
+        self: Self,
+        serial: PositiveInt,
+        sources: Sequence[SortedIterable[tuple[Bytes32, Bytes32 | None]]],
+        older: list[Run],
+    ) -> tuple[list[TableInfo], CompactionInfo]:
+        """Слить источники в новые таблицы уровня и получить статистику слияния.
+
+        Примечания:
+            * Источники упорядочены от новых к старым, и от ключа остается самая новая версия;
+            * Надгробие отбрасывается, если ключ не попадает в диапазоны таблиц `older`.
+        """
+        counter: Counter[str] = Counter()
+
+        iterable = merged(*(self._measure(source, counter) for source in sources))
+        added = self._write_tables(serial, self._drop_tombstones(iterable, older, counter))
+
+        stats = CompactionInfo(
+            tombstones_dropped=counter["tombstones"],
+            bytes_reclaimed=counter["read"] - counter["written"],
+        )
+
+        return (added, stats)
+
+    def _measure(
+        self: Self,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+        counter: Counter[str],
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Выдать пары источника, учитывая их размер."""
+        for key, value in iterable:
+            counter["read"] += len(key) + len(value or b"")
+            yield (key, value)
+
+    def _drop_tombstones(
+        self: Self,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+        older: list[Run],
+        counter: Counter[str],
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Выдать пары без надгробий, под которыми нет более старых версий ключа.
+
+        Примечания:
+            * Диапазоны таблиц проверяются без чтения: надгробие может остаться и без нужды.
+        """
+        for key, value in iterable:
+            if value is None and not any(run.find(key) for run in older):
+                counter["tombstones"] += 1
+                continue
+
+            counter["written"] += len(key) + len(value or b"")
+            yield (key, value)
+
+    def _write_tables(
+        self: Self,
+        serial: PositiveInt,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+    ) -> list[TableInfo]:
+        """Записать пары в новые таблицы уровня."""
+        infos: list[TableInfo] = []
+        iterator = iter(iterable)
+
+        for head in iterator:
+            table = self.manifest.create_table()
+            keys = [head[0]]
+
+            sstable = self.sstable_factory(table, serial)
+            sstable.write(self._take(head, iterator, keys))
+
+            info = TableInfo(table, keys[0], keys[-1], table.sstable.stat().st_size)
+            infos.append(info)
+
+        return infos
+
+    def _take(
+        self: Self,
+        head: tuple[Bytes32, Bytes32 | None],
+        iterator: Iterator[tuple[Bytes32, Bytes32 | None]],
+        keys: list[Bytes32],
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Выдать пары, пока их суммарный размер меньше `table_size`.
+
+        Примечания:
+            * Последний выданный ключ дописывается в `keys`.
+        """
+        size = 0
+
+        for key, value in itertools.chain([head], iterator):
+            yield (key, value)
+
+            size += len(key) + len(value or b"")
+
+            if size >= self.table_size:
                 break
 
-            if sandbox_key < sstable_key:
-                yield sandbox_pair
-                sandbox_pair = None
+        keys.append(key)
+
+    def _publish(
+        self: Self,
+        removed: list[TableInfo],
+        added: Mapping[PositiveInt, list[TableInfo]],
+        *,
+        stats: CompactionInfo | None = None,
+        separate: bool = False,
+    ) -> None:
+        """Опубликовать изменения в манифесте и удалить ставшие ненужными таблицы.
+
+        Примечания:
+            * Директории новых таблиц сбрасываются на диск до того, как на них сошлется манифест;
+            * Таблицы удаляются после публикации: прерванное слияние оставляет лишь мусор;
+            * Статистика слияния `stats` учитывается в момент публикации.
+        """
+        kept = {info.table.path for infos in added.values() for info in infos}
+        obsolete = [info.table for info in removed if info.table.path not in kept]
+
+        fresh = kept - {info.table.path for info in removed}
+
+        for path in fresh | {path.parent for path in fresh}:
+            fsync_directory(path)
+
+        with self.lock:
+            self.manifest.apply(removed, added, separate=separate)
 
-            elif sandbox_key == sstable_key:
-                yield sandbox_pair
-                sandbox_pair = None
-                sstable_pair = None
+            if stats is not None:
+                self._stats = CompactionInfo(
+                    tombstones_dropped=self._stats.tombstones_dropped + stats.tombstones_dropped,
+                    bytes_reclaimed=self._stats.bytes_reclaimed + stats.bytes_reclaimed,
+                )
 
-            else:
-                yield sstable_pair
-                sstable_pair = None
+            for table in obsolete:
+                self._notify(table)
 
-        if sandbox_pair is not None:
-            yield sandbox_pair
-            yield from sandbox_iterator
+        for table in obsolete:
+            table.delete()
 
-        if sstable_pair is not None:
-            yield sstable_pair
-            yield from sstable_iterator
+    def _notify(self: Self, table: Table) -> None:
+        """Сообщить, что таблица удалена."""
+        if self.on_replace is not None:
+            self.on_replace(table)
@@ -3,6 +3,7 @@ from io import BufferedReader
 from typing import Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.dtypes.uint32 import Uint32
 from lsmtree.domain.dtypes.uint1024 import Uint1024
 from lsmtree.domain.services.interfaces.reader import Reader as Interface
 from lsmtree.infrastructure.adapters.readers.uint32 import Reader as Uint32Reader
@@ -79,6 +80,8 @@ class Reader(Interface[Bytes32]):
             return
 
         length = self._uint32_reader.read()
+        self._offset_debt += Uint32.bytes
+
         if not length:
             bytes32 = Bytes32(b"")
             self._storage = bytes32
@@ -6,15 +6,23 @@ from lsmtree.domain.dtypes.bytes32 import Bytes32
 from lsmtree.domain.dtypes.uint1024 import Uint1024
 from lsmtree.domain.services.interfaces.reader import Reader as Interface
 from lsmtree.infrastructure.adapters.readers.bytes32 import Reader as Bytes32Reader
-from lsmtree.infrastructure.adapters.readers.uint1024 import Reader as Uint1024Reader
+from lsmtree.infrastructure.adapters.readers.uint64 import Reader as Uint64Reader
+from lsmtree.utils.typing import NonNegativeInt
 
 
 @dataclass
 class Reader(Interface[tuple[Bytes32, Uint1024]]):
-    """Оператор чтения."""
+    """Оператор чтения.
+
+    Примечания:
+        * Смещения хранятся в 8 байтах.
+    """
 
     buffer: BufferedReader
 
+    _offset_value: NonNegativeInt = 0
+    _offset_debt: NonNegativeInt = 0
+
     _storage: tuple[Bytes32, Uint1024] | None = None
 
     _is_broken_flag: bool = False
@@ -22,7 +30,7 @@ class Reader(Interface[tuple[Bytes32, Uint1024]]):
     def __post_init__(self: Self) -> None:
         """Дополнительная инициализация объекта."""
         self._bytes32_reader = Bytes32Reader(self.buffer)
-        self._uint1024_reader = Uint1024Reader(self.buffer)
+        self._offset_reader = Uint64Reader(self.buffer)
 
     def read(self: Self) -> tuple[Bytes32, Uint1024]:
         """Считать следующее значение.
@@ -40,6 +48,9 @@ class Reader(Interface[tuple[Bytes32, Uint1024]]):
         key, offset = self._storage
         self._storage = None
 
+        self._offset_value += self._offset_debt
+        self._offset_debt = 0
+
         return (key, offset)
 
     def has_next(self: Self) -> bool:
@@ -60,7 +71,7 @@ class Reader(Interface[tuple[Bytes32, Uint1024]]):
     @property
     def offset(self: Self) -> Uint1024:
         """Получить смещение относительно начала буффера."""
-        return max(self._bytes32_reader.offset, self._uint1024_reader.offset)
+        return Uint1024(self._offset_value)
 
     def _fetch(self: Self) -> None:
         """Подтянуть данные из буффера."""
@@ -75,9 +86,14 @@ class Reader(Interface[tuple[Bytes32, Uint1024]]):
 
         key = self._bytes32_reader.read()
 
-        if not self._uint1024_reader.has_next():
+        if not self._offset_reader.has_next():
             self._is_broken_flag = True
             return
 
-        offset = self._uint1024_reader.read()
+        offset = Uint1024(self._offset_reader.read())
         self._storage = (key, offset)
+        self._offset_debt = self._get_consumed() - self._offset_value
+
+    def _get_consumed(self: Self) -> NonNegativeInt:
+        """Получить число байт, считанных из буффера."""
+        return self._bytes32_reader.offset + self._offset_reader.offset
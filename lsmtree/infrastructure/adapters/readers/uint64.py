@@ -2,13 +2,14 @@ from dataclasses import dataclass
 from io import BufferedReader
 from typing import Self
 
+from lsmtree.domain.dtypes.uint64 import Uint64
 from lsmtree.domain.dtypes.uint1024 import Uint1024
 from lsmtree.domain.services.interfaces.reader import Reader as Interface
 from lsmtree.utils.typing import NonNegativeInt
 
 
 @dataclass
-class Reader(Interface[Uint1024]):
+class Reader(Interface[Uint64]):
     """Оператор чтения."""
 
     buffer: BufferedReader
@@ -16,11 +17,11 @@ class Reader(Interface[Uint1024]):
     _offset_value: NonNegativeInt = 0
     _offset_debt: NonNegativeInt = 0
 
-    _storage: Uint1024 | None = None
+    _storage: Uint64 | None = None
 
     _is_broken_flag: bool = False
 
-    def read(self: Self) -> Uint1024:
+    def read(self: Self) -> Uint64:
         """Считать следующее значение.
 
         Примечания:
@@ -30,16 +31,16 @@ class Reader(Interface[Uint1024]):
             self._fetch()
 
         if self._storage is None:
-            detail = "The next 'Uint1024' does not exist"
+            detail = "The next 'Uint64' does not exist"
             raise RuntimeError(detail)
 
-        uint1024 = self._storage
+        uint64 = self._storage
         self._storage = None
 
         self._offset_value += self._offset_debt
         self._offset_debt = 0
 
-        return uint1024
+        return uint64
 
     def has_next(self: Self) -> bool:
         """Проверить, есть ли следующее значение.
@@ -69,13 +70,13 @@ class Reader(Interface[Uint1024]):
         if self._is_broken_flag:
             return
 
-        chunk = self.buffer.read(Uint1024.bytes)
+        chunk = self.buffer.read(Uint64.bytes)
         self._offset_debt += len(chunk)
 
-        if len(chunk) > 0 and len(chunk) != Uint1024.bytes:
+        if len(chunk) > 0 and len(chunk) != Uint64.bytes:
             self._is_broken_flag = True
             return
 
         if chunk:
             integer = int.from_bytes(chunk)
-            self._storage = Uint1024(integer)
+            self._storage = Uint64(integer)
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.services.interfaces.compaction_strategy import (
+    CompactionStrategy as Interface,
+)
+from lsmtree.domain.services.interfaces.manifest import Manifest
+from lsmtree.domain.services.interfaces.merger import Merger
+from lsmtree.utils.typing import PositiveInt, SortedIterable
+
+
+@dataclass
+class SizeTieredCompaction(Interface):
+    """Реализация размерно-ярусной компакции.
+
+    Примечания:
+        * Выгрузка добавляет новый прогон первого уровня, не переписывая старые;
+        * Накопив `merge_width` прогонов, уровень сливает их в один прогон следующего уровня;
+        * Прогоны уровня получаются из одинакового числа слитых прогонов, поэтому близки по размеру;
+        * Ключ переписывается раз на уровень, но при чтении проверяется каждый прогон;
+        * Выгрузка ждет компакции, пока на уровне не меньше `stall_width` прогонов.
+    """
+
+    manifest: Manifest
+    merger: Merger
+
+    # Число прогонов уровня, которые сливаются вместе
+    merge_width: PositiveInt = 4
+
+    # Число прогонов уровня, при котором выгрузка ждет компакции
+    # Примечание: не меньше `merge_width`, иначе выгрузка ждет уровень, который не компактится
+    stall_width: PositiveInt = 8
+
+    def flush(
+        self: Self,
+        serial: PositiveInt,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+    ) -> None:
+        """Выгрузить пары `MemTable` новым прогоном уровня."""
+        self.merger.add_run(serial, iterable)
+
+    def get_pressure(self: Self, serial: PositiveInt) -> float:
+        """Получить давление уровня: отношение числа прогонов уровня к `merge_width`."""
+        return len(self.manifest.get_level(serial)) / self.merge_width
+
+    def must_stall(self: Self, serial: PositiveInt) -> bool:
+        """Проверить, не меньше ли число прогонов уровня `stall_width`."""
+        return len(self.manifest.get_level(serial)) >= self.stall_width
+
+    def compact(self: Self, serial: PositiveInt) -> None:
+        """Слить прогоны уровня в новый прогон следующего уровня."""
+        self.merger.merge_runs(serial)
@@ -1,38 +1,66 @@
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Self
+from typing import ClassVar, Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
 from lsmtree.domain.dtypes.uint1024 import Uint1024
 from lsmtree.domain.services.interfaces.sparse_index import SparseIndex as Interface
+from lsmtree.infrastructure.adapters.encoders.keyoffset import Encoder
 from lsmtree.infrastructure.adapters.readers.keyoffset import Reader
-from lsmtree.infrastructure.adapters.writers.keyoffset import Writer
 from lsmtree.utils.itertools import batched, distanced
 from lsmtree.utils.typing import NonNegativeInt, SortedIterable
 
 
 @dataclass
 class SparseIndex(Interface):
-    """Разреженный индекс."""
+    """Разреженный индекс.
+
+    Примечания:
+        * Индекс читается из файла один раз и хранится в памяти;
+        * Файлу без заголовка нельзя доверять: смещения устаревшего формата указывают
+          в середину записей, поэтому такой индекс строится заново.
+    """
 
     path: Path
 
+    _keys: list[Bytes32] | None = None
+    _offsets: "array[int] | None" = None
+
+    # Заголовок файла: длина ключа, недостижимая на практике, и сигнатура
+    _magic: ClassVar[bytes] = b"\xff\xff\xff\xffSPIX"
+    _version: ClassVar[int] = 2
+
     def get(self: Self, key: Bytes32) -> Uint1024:
         """Получить ближайшее к ключу смещение."""
-        offset = Uint1024(0)
+        position = self.search(key)
 
-        with self.path.open(mode="rb") as buffer:
-            reader = Reader(buffer)
+        if position < 0:
+            return Uint1024(0)
 
-            while reader.has_next():
-                next_key, next_offset = reader.read()
+        _, offset = self[position]
+        return offset
 
-                if key < next_key:
-                    break
+    def search(self: Self, key: Bytes32, start: NonNegativeInt = 0) -> int:
+        """Получить позицию ближайшего к ключу смещения.
 
-                offset = next_offset
+        Примечания:
+            * Возвращает `-1`, если ключ меньше всех ключей индекса;
+            * Поиск ведется, начиная от позиции `start`, что позволяет идти по индексу вперед.
+        """
+        keys, _ = self._get_arrays()
+        return bisect_right(keys, key, lo=start) - 1
 
-        return offset
+    def __getitem__(self: Self, position: NonNegativeInt) -> tuple[Bytes32, Uint1024]:
+        """Получить пару 'ключ-смещение' по позиции."""
+        keys, offsets = self._get_arrays()
+        return (keys[position], Uint1024(offsets[position]))
+
+    def __len__(self: Self) -> NonNegativeInt:
+        """Получить число пар в индексе."""
+        keys, _ = self._get_arrays()
+        return len(keys)
 
     def from_iterable(
         self: Self,
@@ -40,10 +68,72 @@ class SparseIndex(Interface):
         distance: NonNegativeInt,
     ) -> None:
         """Построить индекс."""
+        keys: list[Bytes32] = []
+        offsets: array[int] = array("Q")
+
         with self.path.open(mode="wb") as buffer:
-            writer = Writer(buffer)
+            buffer.write(self._magic)
+            buffer.write(self._version.to_bytes(1))
+
+            encoder = Encoder(buffer)
 
             for batch in batched(iterable):
                 for key, offset in distanced(batch, distance):
                     pair = (key, offset)
-                    writer.write(pair)
+                    encoder.write(pair)
+
+                    keys.append(key)
+                    offsets.append(offset)
+
+            encoder.flush()
+
+        self._keys = keys
+        self._offsets = offsets
+
+    def from_pairs(self: Self, iterable: SortedIterable[tuple[Bytes32, Uint1024]]) -> None:
+        """Построить индекс в памяти, не записывая индекс на диск."""
+        keys: list[Bytes32] = []
+        offsets: array[int] = array("Q")
+
+        for key, offset in iterable:
+            keys.append(key)
+            offsets.append(offset)
+
+        self._keys = keys
+        self._offsets = offsets
+
+    def load(self: Self) -> None:
+        """Считать индекс в память."""
+        keys: list[Bytes32] = []
+        offsets: array[int] = array("Q")
+
+        with self.path.open(mode="rb") as buffer:
+            if buffer.read(len(self._magic)) != self._magic:
+                detail = "The sparse index has no header"
+                raise ValueError(detail)
+
+            if int.from_bytes(buffer.read(1)) != self._version:
+                detail = "The sparse index format is not supported"
+                raise ValueError(detail)
+
+            reader = Reader(buffer)
+
+            while reader.has_next():
+                key, offset = reader.read()
+
+                keys.append(key)
+                offsets.append(offset)
+
+        self._keys = keys
+        self._offsets = offsets
+
+    def _get_arrays(self: Self) -> tuple[list[Bytes32], "array[int]"]:
+        """Получить ключи и смещения, считав индекс при необходимости."""
+        if self._keys is None or self._offsets is None:
+            self.load()
+
+        if self._keys is None or self._offsets is None:
+            detail = "Failed to load the sparse index"
+            raise RuntimeError(detail)
+
+        return (self._keys, self._offsets)
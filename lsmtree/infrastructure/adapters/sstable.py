@@ -1,35 +1,80 @@
-from dataclasses import dataclass
-from typing import ClassVar, Self
+import itertools
+import mmap
+import os
+import struct
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, ClassVar, Self, TypeAlias
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.dtypes.compression import Compression
+from lsmtree.domain.dtypes.uint64 import Uint64
 from lsmtree.domain.dtypes.uint1024 import Uint1024
-from lsmtree.domain.entities.level import Level
+from lsmtree.domain.entities.bloomfilter_policy import BloomFilterPolicy
+from lsmtree.domain.entities.table import Table
 from lsmtree.domain.services.interfaces.bloomfilter import BloomFilter as BloomFilterInterface
+from lsmtree.domain.services.interfaces.cache import Cache
 from lsmtree.domain.services.interfaces.sparse_index import SparseIndex as SparseIndexInterface
 from lsmtree.domain.services.interfaces.sstable import SortedStringTable as Interface
+from lsmtree.infrastructure.adapters.block import Block, BlockBuilder
 from lsmtree.infrastructure.adapters.bloomfilter import BloomFilter
-from lsmtree.infrastructure.adapters.readers.keyvalue import Reader
+from lsmtree.infrastructure.adapters.compressor import Compressor
+from lsmtree.infrastructure.adapters.decoders.keyvalue import Decoder
 from lsmtree.infrastructure.adapters.sparse_index import SparseIndex
-from lsmtree.infrastructure.adapters.writers.keyvalue import Writer
 from lsmtree.utils.itertools import batched
-from lsmtree.utils.typing import PositiveInt, SortedIterable, SortedIterator
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt, SortedIterable, SortedIterator
+
+
+# Ключ кэша блоков: номер таблицы, поколение файла и смещение блока
+BlockCacheKey: TypeAlias = tuple[PositiveInt, PositiveInt, NonNegativeInt]
 
 
 @dataclass
 class SortedStringTable(Interface):
-    """Интерфейс структуры данных `SSTable`."""
+    """Реализация структуры данных `SSTable`.
+
+    Примечания:
+        * Таблица состоит из заголовка, блоков данных, индексного блока и футера;
+        * Каждый блок сжимается отдельно, тип сжатия хранится в трейлере блока;
+        * Таблицы устаревшего формата (поток записей без заголовка) доступны для чтения;
+        * Файл таблицы отображается в память один раз, и чтения сводятся к срезам.
+    """
 
-    level: Level
+    table: Table
+    bloom_filter_policy: BloomFilterPolicy = field(default_factory=BloomFilterPolicy)
+    block_cache: Cache[BlockCacheKey, Block] | None = None
+    compression: Compression = Compression.NONE
 
     _bloom_filter: BloomFilterInterface | None = None
     _sparse_index: SparseIndexInterface | None = None
 
-    # Фильтра Блума требует указания числа хэшей
-    _number_of_hashes: ClassVar[PositiveInt] = 1
+    _memory: memoryview | None = None
+    _is_legacy: bool = False
+    _data_end: NonNegativeInt = 0
+    _number_of_entries: NonNegativeInt | None = None
+    _generation: NonNegativeInt = 0
+
+    # Поколение выдается при каждом отображении файла и отличает версии файла в кэше блоков
+    _generations: ClassVar[Iterator[PositiveInt]] = itertools.count(1)
 
     # Индекс требует расстояние между ключами
     _distance: ClassVar[PositiveInt] = 32
 
+    # Размер блока данных, по достижении которого начинается новый блок [в байтах]
+    _block_size: ClassVar[PositiveInt] = 4 * 1024  # 4 KiB
+
+    # Размер буффера записи: блоки уходят в файл крупными порциями [в байтах]
+    _write_buffer_size: ClassVar[PositiveInt] = 1024 * 1024  # 1 MiB
+
+    # Заголовок файла: длина ключа, недостижимая на практике, сигнатура и версия
+    _magic: ClassVar[bytes] = b"\xff\xff\xff\xffSSTB"
+    _version: ClassVar[int] = 1
+
+    # Футер файла: смещение индексного блока, число записей и сигнатура
+    _footer: ClassVar[struct.Struct] = struct.Struct(">QQ8s")
+
     def get(self: Self, key: Bytes32) -> Bytes32 | None:
         """Получить значение по ключу."""
         self._guarantee_efficiency()
@@ -42,45 +87,157 @@ class SortedStringTable(Interface):
             detail = f"The key {key!r} does not exist"
             raise KeyError(detail)
 
-        with self.level.sstable.open(mode="rb") as buffer:
-            offset = self._sparse_index.get(key)
-            buffer.seek(offset)
-
-            reader = Reader(buffer)
+        position = self._sparse_index.search(key)
 
-            candidate: Bytes32 | None = None
-            value: Bytes32 | None = None
+        if self._is_legacy:
+            return self._get_legacy(key, max(position, 0))
 
-            while (candidate is None or candidate < key) and reader.has_next():
-                candidate, value = reader.read()
-
-        if key != candidate:
+        if position < 0:
             detail = f"The key {key!r} does not exist"
             raise KeyError(detail)
 
-        return value
+        return self._get_block(position).get(key)
+
+    def get_many(self: Self, keys: SortedIterable[Bytes32]) -> dict[Bytes32, Bytes32 | None]:
+        """Получить значения по упорядоченным ключам.
+
+        Примечания:
+            * Отсутствующие ключи не попадают в результат;
+            * Индекс просматривается одним проходом, и каждый блок считывается один раз.
+        """
+        self._guarantee_efficiency()
+
+        if self._bloom_filter is None or self._sparse_index is None:
+            detail = "Failed to guarantee an efficient access"
+            raise RuntimeError(detail)
+
+        pairs: dict[Bytes32, Bytes32 | None] = {}
+
+        block: Block | None = None
+        block_position = -1
+
+        position = 0
+
+        for key in keys:
+            if not self._bloom_filter.test(key):
+                continue
+
+            position = self._sparse_index.search(key, max(position, 0))
+
+            try:
+                if self._is_legacy:
+                    pairs[key] = self._get_legacy(key, max(position, 0))
+                    continue
+
+                if position < 0:
+                    continue
+
+                if block is None or position != block_position:
+                    block = self._get_block(position)
+                    block_position = position
+
+                pairs[key] = block.get(key)
+
+            except KeyError:
+                continue
+
+        return pairs
+
+    def seek(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по таблице, начиная от первого ключа не меньше данного.
+
+        Примечания:
+            * Начальный блок находится по разреженному индексу и берется через кэш блоков;
+            * Последующие блоки читаются напрямую, чтобы обход не вытеснял кэш.
+        """
+        if self._sparse_index is None:
+            self._load_sparse_index()
+
+        if self._memory is None or self._sparse_index is None:
+            detail = "Failed to guarantee an efficient access"
+            raise RuntimeError(detail)
+
+        position = 0 if key is None else max(self._sparse_index.search(key), 0)
+
+        if self._is_legacy:
+            start, _ = self._get_bounds(position)
+            return self._get_legacy_iterator(key, self._memory[start : self._data_end])
+
+        if position >= len(self._sparse_index):
+            return iter(())
+
+        # Срезы фиксируются заранее: таблицу могут закрыть или заменить во время обхода
+        block = self._get_block(position)
+        serials = range(position + 1, len(self._sparse_index))
+        slices = [self._get_slice(serial) for serial in serials]
+
+        return self._get_seek_iterator(key, block, slices)
+
+    def seek_reverse(
+        self: Self,
+        key: Bytes32 | None = None,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по таблице, начиная от последнего ключа меньше данного.
+
+        Примечания:
+            * Блоки перебираются по индексу от конца к началу, внутри блока - по точкам рестарта;
+            * Таблицы устаревшего формата разбираются вперед по отрезкам разреженного индекса.
+        """
+        if self._sparse_index is None:
+            self._load_sparse_index()
+
+        if self._memory is None or self._sparse_index is None:
+            detail = "Failed to guarantee an efficient access"
+            raise RuntimeError(detail)
+
+        position = len(self._sparse_index) - 1
+
+        if key is not None:
+            position = self._sparse_index.search(key)
+
+        if self._is_legacy:
+            slices = [self._get_slice(serial) for serial in range(max(position, 0), -1, -1)]
+            return self._get_legacy_reverse_iterator(key, slices)
 
-    def from_iterable(self: Self, iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]]) -> None:
-        """Построить песочную `SSTable`."""
-        self.level.untrust_sandbox()
+        if position < 0:
+            return iter(())
 
-        with self.level.sandbox.open(mode="wb") as buffer:
-            writer = Writer(buffer)
+        block = self._get_block(position)
+        slices = [self._get_slice(serial) for serial in range(position - 1, -1, -1)]
 
-            for key, value in iterable:
-                pair = (key, value)
-                writer.write(pair)
+        return self._get_seek_reverse_iterator(key, block, slices)
 
-        self.level.trust_sandbox()
+    def write(self: Self, iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Записать `SSTable`.
 
-    def over_sandbox(self: Self) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
-        """Получить итератор по таблице из песочницы."""
-        with self.level.sandbox.open(mode="rb") as buffer:
-            reader = Reader(buffer)
+        Примечания:
+            * Фильтр Блума строится по ключам, которые проходят через запись, и сразу сохраняется;
+            * Разреженный индекс - индексный блок таблицы, он читается при первом чтении;
+            * Файл таблицы сбрасывается на диск, чтобы манифест не ссылался на неполные данные.
+        """
+        self.table.untrust_bloom_filter()
+        self.table.untrust_sparse_index()
 
-            while reader.has_next():
-                key, value = reader.read()
-                yield (key, value)
+        with self.table.sstable.open(mode="wb", buffering=self._write_buffer_size) as buffer:
+            keys = self._write(buffer, iterable)
+
+            buffer.flush()
+            os.fsync(buffer.fileno())
+
+        self._build_bloom_filter(keys, len(keys))
+
+    def close(self: Self) -> None:
+        """Отпустить отображение файла и загруженные структуры данных.
+
+        Примечания:
+            * Отображение закрывается, когда на него не остается ссылок, например, из кэша блоков.
+        """
+        self._memory = None
+        self._bloom_filter = None
+        self._sparse_index = None
 
     def __contains__(self: Self, key: Bytes32) -> bool:
         """Проверить наличие ключа."""
@@ -93,59 +250,317 @@ class SortedStringTable(Interface):
 
     def __iter__(self: Self) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
         """Получить итератор по таблице."""
-        with self.level.sstable.open(mode="rb") as buffer:
-            reader = Reader(buffer)
+        return self._get_file_iterator(self.table.sstable)
+
+    def _get_file_iterator(
+        self: Self,
+        path: Path,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по файлу таблицы."""
+        memory = self._map(path)
+
+        if self._is_legacy_memory(memory):
+            yield from Decoder(memory)
+            return
+
+        pairs, data_end, _ = self._read_index(memory)
+
+        for position, (_, start) in enumerate(pairs):
+            stop = pairs[position + 1][1] if position + 1 < len(pairs) else data_end
+            yield from self._decode_block(memory[start:stop])
+
+    def _get_seek_iterator(
+        self: Self,
+        key: Bytes32 | None,
+        block: Block,
+        slices: list[memoryview],
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по начальному блоку и срезам последующих блоков."""
+        yield from (iter(block) if key is None else block.seek(key))
+
+        for data in slices:
+            yield from self._decode_block(data)
+
+    def _get_legacy_iterator(
+        self: Self,
+        key: Bytes32 | None,
+        data: memoryview,
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по срезу таблицы устаревшего формата."""
+        for candidate, value in Decoder(data):
+            if key is None or candidate >= key:
+                yield (candidate, value)
+
+    def _get_seek_reverse_iterator(
+        self: Self,
+        key: Bytes32 | None,
+        block: Block,
+        slices: list[memoryview],
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по начальному блоку и срезам предыдущих блоков."""
+        yield from block.seek_reverse(key)
+
+        for data in slices:
+            yield from reversed(self._decode_block(data))
+
+    def _get_legacy_reverse_iterator(
+        self: Self,
+        key: Bytes32 | None,
+        slices: list[memoryview],
+    ) -> SortedIterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить обратный итератор по срезам таблицы устаревшего формата."""
+        for data in slices:
+            pairs = list(self._get_legacy_iterator(None, data))
+
+            for candidate, value in reversed(pairs):
+                if key is None or candidate < key:
+                    yield (candidate, value)
+
+    def _get_legacy(self: Self, key: Bytes32, position: NonNegativeInt) -> Bytes32 | None:
+        """Получить значение по ключу из таблицы устаревшего формата."""
+        for view, value, _ in Decoder(self._get_slice(position)).records():
+            candidate = bytes(view)
+
+            if candidate == key:
+                return None if value is None else Bytes32(value)
+
+            if candidate > key:
+                break
+
+        detail = f"The key {key!r} does not exist"
+        raise KeyError(detail)
+
+    def _write(
+        self: Self,
+        buffer: BinaryIO,
+        iterable: SortedIterable[tuple[Bytes32, Bytes32 | None]],
+    ) -> list[Bytes32]:
+        """Записать таблицу в буффер и получить ключи таблицы для фильтра Блума."""
+        buffer.write(self._magic + self._version.to_bytes(1))
+        offset = len(self._magic) + 1
+
+        block = BlockBuilder()
+        index = BlockBuilder(restart_interval=1)
+
+        first_key = Bytes32(b"")
+        keys: list[Bytes32] = []
+
+        for key, value in iterable:
+            if block.is_empty():
+                first_key = key
+
+            block.add(key, value)
+            keys.append(key)
+
+            if block.size >= self._block_size:
+                index.add(first_key, Bytes32(offset.to_bytes(Uint64.bytes)))
+                offset += self._write_block(buffer, block)
+
+        if not block.is_empty():
+            index.add(first_key, Bytes32(offset.to_bytes(Uint64.bytes)))
+            offset += self._write_block(buffer, block)
+
+        index_offset = offset
+        self._write_block(buffer, index)
+
+        buffer.write(self._footer.pack(index_offset, len(keys), self._magic))
+
+        return keys
+
+    def _write_block(self: Self, buffer: BinaryIO, block: BlockBuilder) -> NonNegativeInt:
+        """Записать блок в буффер и получить размер блока."""
+        compression, data = Compressor(self.compression).compress(block.finish())
+        data += compression.to_bytes(1)
+        block.reset()
+
+        buffer.write(data)
+        return len(data)
+
+    def _get_block(self: Self, position: NonNegativeInt) -> Block:
+        """Получить блок по позиции в индексе, используя кэш блоков."""
+        if self.block_cache is None:
+            return self._decode_block(self._get_slice(position))
+
+        start, _ = self._get_bounds(position)
+        key = (self.table.serial, self._generation, start)
+
+        block = self.block_cache.get(key)
+
+        if block is None:
+            block = self._decode_block(self._get_slice(position))
+            self.block_cache.put(key, block, len(block.data))
+
+        return block
+
+    def _get_slice(self: Self, position: NonNegativeInt) -> memoryview:
+        """Получить срез файла по позиции в индексе."""
+        if self._memory is None:
+            detail = "Failed to guarantee an efficient access"
+            raise RuntimeError(detail)
+
+        start, stop = self._get_bounds(position)
+        return self._memory[start:stop]
+
+    def _get_bounds(self: Self, position: NonNegativeInt) -> tuple[NonNegativeInt, NonNegativeInt]:
+        """Получить границы блока по позиции в индексе."""
+        if self._sparse_index is None or position >= len(self._sparse_index):
+            return (0, self._data_end)
+
+        _, start = self._sparse_index[position]
+
+        if position + 1 < len(self._sparse_index):
+            _, stop = self._sparse_index[position + 1]
+            return (start, stop)
+
+        return (start, self._data_end)
+
+    def _decode_block(self: Self, data: memoryview) -> Block:
+        """Разобрать блок, включая трейлер."""
+        try:
+            compression = Compression(data[-1])
+        except (IndexError, ValueError) as exception:
+            detail = "The block compression is not supported"
+            raise ValueError(detail) from exception
+
+        if compression == Compression.NONE:
+            return Block(data[:-1])
+
+        return Block(Compressor.decompress(compression, bytes(data[:-1])))
+
+    def _read_index(
+        self: Self,
+        memory: memoryview,
+    ) -> tuple[list[tuple[Bytes32, Uint1024]], NonNegativeInt, NonNegativeInt]:
+        """Считать индексный блок, конец блоков данных и число записей."""
+        size = len(memory)
+
+        if size < len(self._magic) + 1 + self._footer.size:
+            detail = "The table is broken"
+            raise ValueError(detail)
+
+        index_offset, number_of_entries, magic = self._footer.unpack_from(
+            memory,
+            size - self._footer.size,
+        )
+
+        if magic != self._magic:
+            detail = "The table footer is broken"
+            raise ValueError(detail)
+
+        index = self._decode_block(memory[index_offset : size - self._footer.size])
 
-            while reader.has_next():
-                key, value = reader.read()
-                yield (key, value)
+        pairs = [(key, Uint1024(int.from_bytes(value or b""))) for key, value in index]
+        return (pairs, index_offset, number_of_entries)
+
+    def _is_legacy_memory(self: Self, memory: memoryview) -> bool:
+        """Проверить, записана ли таблица в устаревшем формате."""
+        if memory[: len(self._magic)] != self._magic:
+            return True
+
+        if memory[len(self._magic)] != self._version:
+            detail = "The table format is not supported"
+            raise ValueError(detail)
+
+        return False
+
+    @staticmethod
+    def _map(path: Path) -> memoryview:
+        """Отобразить файл в память только для чтения."""
+        with path.open(mode="rb") as buffer:
+            if os.fstat(buffer.fileno()).st_size == 0:
+                return memoryview(b"")
+
+            return memoryview(mmap.mmap(buffer.fileno(), 0, access=mmap.ACCESS_READ))
 
     def _guarantee_efficiency(self: Self) -> None:
         """Прогрузить структуры данных, требующиеся для эффективности."""
-        if self._bloom_filter is None:
-            self._load_bloom_filter()
-
         if self._sparse_index is None:
             self._load_sparse_index()
 
+        if self._bloom_filter is None:
+            self._load_bloom_filter()
+
     def _load_bloom_filter(self: Self) -> None:
         """Построить фильтр Блума."""
-        if self.level.has_trusted_bloom_filter():
-            with self.level.bloom_filter.open(mode="rb") as buffer:
-                self._bloom_filter = BloomFilter.load(buffer)
-                return
-
-        self._bloom_filter = BloomFilter(self._number_of_hashes)
-
-        for batch in batched(self):
-            for key, _ in batch:
-                self._bloom_filter.add(key)
-
-        with self.level.bloom_filter.open(mode="wb") as buffer:
+        if self.table.has_trusted_bloom_filter():
+            try:
+                with self.table.bloom_filter.open(mode="rb") as buffer:
+                    self._bloom_filter = BloomFilter.load(buffer)
+                    return
+            except ValueError:
+                self.table.untrust_bloom_filter()
+
+        number_of_keys = self._number_of_entries
+
+        if number_of_keys is None:
+            number_of_keys = sum(len(batch) for batch in batched(self))
+
+        keys = (key for batch in batched(self) for key, _ in batch)
+        self._build_bloom_filter(keys, number_of_keys)
+
+    def _build_bloom_filter(
+        self: Self,
+        keys: Iterable[Bytes32],
+        number_of_keys: NonNegativeInt,
+    ) -> None:
+        """Построить фильтр Блума по ключам таблицы и сохранить фильтр.
+
+        Примечания:
+            * Метка доверия ставится лишь после того, как фильтр сброшен на диск.
+        """
+        self._bloom_filter = BloomFilter(
+            number_of_hashes=self.bloom_filter_policy.number_of_hashes,
+            number_of_bits=self.bloom_filter_policy.get_number_of_bits(number_of_keys),
+        )
+
+        for key in keys:
+            self._bloom_filter.add(key)
+
+        with self.table.bloom_filter.open(mode="wb") as buffer:
             self._bloom_filter.dump(buffer)
 
-        self.level.trust_bloom_filter()
+            buffer.flush()
+            os.fsync(buffer.fileno())
+
+        self.table.trust_bloom_filter()
 
     def _get_offset_mapping_iterator(self: Self) -> SortedIterator[tuple[Bytes32, Uint1024]]:
         """Получить итератор по парам 'ключ-смещение'."""
-        with self.level.sstable.open(mode="rb") as buffer:
-            reader = Reader(buffer)
-            offset = Uint1024(0)
-
-            while reader.has_next():
-                key, _ = reader.read()
-                yield (key, offset)
+        if self._memory is None:
+            detail = "Failed to guarantee an efficient access"
+            raise RuntimeError(detail)
 
-                offset = reader.offset
+        for key, _, offset in Decoder(self._memory).records():
+            yield (Bytes32(key), Uint1024(offset))
 
     def _load_sparse_index(self: Self) -> None:
-        """Построить разреженный индекс."""
-        self._sparse_index = SparseIndex(self.level.sparse_index)
+        """Построить разреженный индекс.
+
+        Примечания:
+            * Для таблиц в блочном формате индексом служит индексный блок.
+        """
+        self._memory = self._map(self.table.sstable)
+        self._generation = next(self._generations)
+
+        self._is_legacy = self._is_legacy_memory(self._memory)
+        self._sparse_index = SparseIndex(self.table.sparse_index)
 
-        if self.level.has_trusted_sparse_index():
+        if not self._is_legacy:
+            pairs, self._data_end, self._number_of_entries = self._read_index(self._memory)
+            self._sparse_index.from_pairs(pairs)
             return
 
+        self._data_end = len(self._memory)
+
+        if self.table.has_trusted_sparse_index():
+            try:
+                self._sparse_index.load()
+            except ValueError:
+                self.table.untrust_sparse_index()
+            else:
+                return
+
         iterable = self._get_offset_mapping_iterator()
         self._sparse_index.from_iterable(iterable, self._distance)
 
-        self.level.trust_sparse_index()
+        self.table.trust_sparse_index()
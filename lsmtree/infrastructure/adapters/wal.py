@@ -1,44 +1,217 @@
-from collections.abc import Iterator
+import os
+import struct
+import threading
+import zlib
+
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 from typing import Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.domain.dtypes.durability import Durability
 from lsmtree.domain.services.interfaces.wal import WriteAheadLog as Interface
-from lsmtree.infrastructure.adapters.readers.keyvalue import Reader
-from lsmtree.infrastructure.adapters.writers.keyvalue import Writer
+from lsmtree.infrastructure.adapters.decoders.keyvalue import Decoder, decode_record
+from lsmtree.infrastructure.adapters.encoders.keyvalue import Encoder
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt
+
+
+# Пакет записей открывается длиной ключа, недостижимой на практике
+BATCH_MARKER = b"\xff\xff\xff\xff"
+
+# Заголовок пакета: длина содержимого и контрольная сумма CRC-32 содержимого
+BATCH_HEADER = struct.Struct(">II")
 
 
 @dataclass
 class WriteAheadLog(Interface):
-    """Реалиация журнала предзаписи."""
+    """Реалиация журнала предзаписи.
+
+    Примечания:
+        * Каждая запись сразу передается ядру, и режим определяет лишь частоту `fsync`;
+        * Режим `GROUP`: один `fsync` покрывает все записи, переданные ядру к началу вызова;
+        * Пока идет `fsync`, другие потоки продолжают дописывать журнал;
+        * Фоновый поток режима `GROUP` сбрасывает записи, пролежавшие дольше `group_interval`.
+    """
 
     path: Path
+    durability: Durability = Durability.NONE
+
+    # Число записей, после которого в режиме `GROUP` вызывается `fsync`
+    group_size: PositiveInt = 128
+
+    # Время, после которого в режиме `GROUP` вызывается `fsync` [в миллисекундах]
+    group_interval: PositiveInt = 10
 
     def __post_init__(self: Self) -> None:
         """Дополнительная инициализация объекта."""
         self._descriptor = self.path.open(mode="ab")
+        self._encoder = Encoder(self._descriptor)
+
+        # Защищает дескриптор и кодировщик от одновременной записи
+        self._lock = threading.Lock()
+
+        # Запрещает двум потокам вызывать `fsync` одновременно
+        self._sync_lock = threading.Lock()
+
+        self._number_of_pending = 0
+        self._closed = threading.Event()
+
+        if self.durability == Durability.GROUP:
+            thread = threading.Thread(target=self._sync_periodically, daemon=True)
+            thread.start()
 
     def write(self: Self, key: Bytes32, value: Bytes32 | None) -> None:
         """Записать значение по ключу."""
         pair = (key, value)
-        Writer(self._descriptor).write(pair)
-        self._descriptor.flush()
+
+        with self._lock:
+            self._encoder.write(pair)
+            must_sync = self._register()
+
+        if must_sync:
+            self.sync()
+
+    def write_many(self: Self, pairs: Iterable[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Атомарно записать пакет пар одной записью журнала.
+
+        Примечания:
+            * Пакет снабжается длиной и контрольной суммой и при восстановлении применяется целиком.
+        """
+        payload = BytesIO()
+
+        encoder = Encoder(payload)
+        encoder.write_many(pairs)
+        encoder.flush()
+
+        content = payload.getbuffer()
+        header = BATCH_HEADER.pack(len(content), zlib.crc32(content))
+
+        with self._lock:
+            self._encoder.flush()
+            self._descriptor.write(BATCH_MARKER + header)
+            self._descriptor.write(content)
+
+            must_sync = self._register()
+
+        if must_sync:
+            self.sync()
+
+    def sync(self: Self) -> None:
+        """Сбросить накопленные записи на диск."""
+        with self._sync_lock:
+            with self._lock:
+                if not self._number_of_pending or self._descriptor.closed:
+                    return
+
+                self._encoder.flush()
+                self._descriptor.flush()
+
+                self._number_of_pending = 0
+                descriptor = self._descriptor.fileno()
+
+            os.fsync(descriptor)
 
     def clear(self: Self) -> None:
         """Очистить журнал предзаписи."""
-        self._descriptor.close()
-        self._descriptor = self.path.open(mode="wb")
+        with self._sync_lock, self._lock:
+            self._descriptor.close()
+
+            self._descriptor = self.path.open(mode="wb")
+            self._encoder = Encoder(self._descriptor)
+
+            self._number_of_pending = 0
+
+    def close(self: Self) -> None:
+        """Сбросить накопленные записи и закрыть журнал."""
+        self._closed.set()
+
+        if self.durability != Durability.NONE:
+            self.sync()
+
+        with self._sync_lock, self._lock:
+            if not self._descriptor.closed:
+                self._encoder.flush()
+                self._descriptor.close()
 
     def __iter__(self: Self) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
-        """Получить итератор по журналу."""
-        with self.path.open(mode="rb") as buffer:
-            reader = Reader(buffer)
+        """Получить итератор по журналу.
+
+        Примечания:
+            * Оборванная или поврежденная последняя запись отрезается от журнала;
+            * Пакет выдается, только если он записан целиком и контрольная сумма сошлась.
+        """
+        data = memoryview(self.path.read_bytes())
+        offset = 0
+
+        while offset < len(data):
+            if data[offset : offset + len(BATCH_MARKER)] == BATCH_MARKER:
+                batch = self._decode_batch(data, offset)
+
+                if batch is None:
+                    break
 
-            while reader.has_next():
-                key, value = reader.read()
-                yield key, value
+                pairs, offset = batch
+                yield from pairs
 
-        if reader.is_broken():
-            self._descriptor.truncate(reader.offset)
+                continue
+
+            record = decode_record(data, offset)
+
+            if record is None:
+                break
+
+            key, value, offset = record
+            yield (Bytes32(key), None if value is None else Bytes32(value))
+
+        if offset < len(data):
+            self._descriptor.truncate(offset)
             self._descriptor.flush()
+
+    def _decode_batch(
+        self: Self,
+        data: memoryview,
+        offset: NonNegativeInt,
+    ) -> tuple[list[tuple[Bytes32, Bytes32 | None]], NonNegativeInt] | None:
+        """Разобрать пакет по смещению или получить `None`, если он оборван или поврежден."""
+        start = offset + len(BATCH_MARKER) + BATCH_HEADER.size
+
+        if start > len(data):
+            return None
+
+        length, checksum = BATCH_HEADER.unpack_from(data, offset + len(BATCH_MARKER))
+        content = data[start : start + length]
+
+        if len(content) != length or zlib.crc32(content) != checksum:
+            return None
+
+        decoder = Decoder(content)
+        pairs = list(decoder)
+
+        if decoder.is_broken():
+            return None
+
+        return (pairs, start + length)
+
+    def _register(self: Self) -> bool:
+        """Передать дописанную запись ядру и определить, нужен ли `fsync`.
+
+        Примечания:
+            * Вызывается под блокировкой записи;
+            * Запись передается ядру в любом режиме, поэтому падение процесса не теряет запись.
+        """
+        self._encoder.flush()
+        self._descriptor.flush()
+
+        if self.durability == Durability.NONE:
+            return False
+
+        self._number_of_pending += 1
+
+        return self.durability == Durability.SYNC or self._number_of_pending >= self.group_size
+
+    def _sync_periodically(self: Self) -> None:
+        """Сбрасывать накопленные записи раз в `group_interval`."""
+        while not self._closed.wait(self.group_interval / 1000):
+            self.sync()
@@ -1,15 +1,41 @@
-from dataclasses import dataclass
+import itertools
+import threading
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, Self
+from sys import getsizeof
+from typing import TYPE_CHECKING, ClassVar, Self
 
 from lsmtree.domain.dtypes.bytes32 import Bytes32
-from lsmtree.domain.entities.level import Level
+from lsmtree.domain.dtypes.compaction import Compaction
+from lsmtree.domain.dtypes.compression import Compression
+from lsmtree.domain.dtypes.durability import Durability
+from lsmtree.domain.entities.bloomfilter_policy import BloomFilterPolicy
+from lsmtree.domain.entities.cache_info import CacheInfo
+from lsmtree.domain.entities.compaction_info import CompactionInfo
+from lsmtree.domain.entities.run import Run
 from lsmtree.domain.entities.storage import Storage
+from lsmtree.domain.entities.table import Table
+from lsmtree.domain.services.interfaces.compaction_strategy import CompactionStrategy
+from lsmtree.domain.services.interfaces.memtable import MemTable as MemTableInterface
+from lsmtree.domain.services.interfaces.wal import WriteAheadLog as WriteAheadLogInterface
+from lsmtree.infrastructure.adapters.compaction_scheduler import CompactionScheduler
+from lsmtree.infrastructure.adapters.leveled_compaction import LeveledCompaction
+from lsmtree.infrastructure.adapters.lru_cache import LRUCache
+from lsmtree.infrastructure.adapters.manifest import Manifest
 from lsmtree.infrastructure.adapters.memtable import MemTable
 from lsmtree.infrastructure.adapters.merger import Merger
-from lsmtree.infrastructure.adapters.sstable import SortedStringTable
+from lsmtree.infrastructure.adapters.size_tiered_compaction import SizeTieredCompaction
+from lsmtree.infrastructure.adapters.sstable import BlockCacheKey, SortedStringTable
 from lsmtree.infrastructure.adapters.wal import WriteAheadLog
-from lsmtree.utils.typing import NonNegativeInt
+from lsmtree.presentation.write_batch import WriteBatch
+from lsmtree.utils.itertools import merged
+from lsmtree.utils.typing import NonNegativeInt, PositiveInt, SortedIterator
+
+
+if TYPE_CHECKING:
+    from lsmtree.infrastructure.adapters.block import Block
 
 
 @dataclass
@@ -17,32 +43,126 @@ class LSMTree:
     """LSM-дерево."""
 
     root: Path
+    bloom_filter_policy: BloomFilterPolicy = field(default_factory=BloomFilterPolicy)
 
     # Размер `MemTable`, по достижении которого будет выгрузка на диск [в байтах]
-    _memtable_threshold: ClassVar[NonNegativeInt] = 1024 * 1024  # 1 MiB
+    # Примечание: размер считает сама реализация `MemTable`
+    memtable_threshold: NonNegativeInt = 4 * 1024 * 1024  # 4 MiB
+
+    # Реализация `MemTable`: `MemTable` на `SortedDict` или компактная `ArenaMemTable`
+    memtable_factory: Callable[[WriteAheadLogInterface], MemTableInterface] = MemTable
+
+    # Режим долговечности журнала предзаписи
+    durability: Durability = Durability.NONE
+
+    # Число записей и время [в миллисекундах], после которых в режиме `GROUP` вызывается `fsync`
+    wal_group_size: PositiveInt = 128
+    wal_group_interval: PositiveInt = 10
+
+    # Стратегия компакции: выравнивающая экономит чтение и место, размерно-ярусная - запись
+    compaction: Compaction = Compaction.LEVELED
+
+    # Целевой размер первого уровня [в байтах]
+    # Примечание: каждый следующий уровень больше предыдущего в `level_size_ratio` раз
+    # Примечание: в размерно-ярусной компакции `level_size_ratio` - число сливаемых прогонов
+    level_base_size: PositiveInt = 4 * 1024 * 1024  # 4 MiB
+    level_size_ratio: PositiveInt = 4
+
+    # Наименьшее допустимое значение `level_size_ratio`
+    _min_size_ratio: ClassVar[PositiveInt] = 2
+
+    # Размер первого уровня, при котором выгрузка `MemTable` ждет компакции [в байтах]
+    # Примечание: в размерно-ярусной компакции выгрузка ждет по числу прогонов `level1_stall_runs`
+    level1_stall_size: PositiveInt = 16 * 1024 * 1024  # 16 MiB
+    level1_stall_runs: PositiveInt = 8
+
+    # Размер данных, по достижении которого слияние начинает следующую таблицу уровня [в байтах]
+    table_size: PositiveInt = 2 * 1024 * 1024  # 2 MiB
 
-    # Количество экземпляров `SSTable`, которые можно выгрузить в RAM
-    # Примечание: в оперативной памяти хранятся лишь фильтры Блума
-    _number_of_cached_sstables: ClassVar[NonNegativeInt] = 128
+    # Бюджет кэша блоков, общего для всех `SSTable` [в байтах]
+    block_cache_capacity: NonNegativeInt = 8 * 1024 * 1024  # 8 MiB
+
+    # Количество экземпляров `SSTable`, которые можно держать в RAM
+    # Примечание: каждый экземпляр хранит фильтр Блума, разреженный индекс и отображение файла
+    table_cache_capacity: PositiveInt = 128
+
+    # Бюджет кэша горячих пар 'ключ-значение' [в байтах]
+    # Примечание: нулевой бюджет отключает кэш
+    row_cache_capacity: NonNegativeInt = 0
+
+    # Бюджет кэша отсутствующих и удаленных ключей [в байтах]
+    # Примечание: нулевой бюджет отключает кэш
+    negative_cache_capacity: NonNegativeInt = 0
+
+    # Сжатие блоков по уровням: последний элемент действует и на все более глубокие уровни
+    compression_per_level: Sequence[Compression] = (Compression.NONE,)
 
     def __post_init__(self: Self) -> None:
         """Дополнительная инициализация объекта."""
+        if not self.compression_per_level:
+            detail = "The compression must be specified at least for the first level"
+            raise ValueError(detail)
+
+        # Слияние не меньше двух прогонов уменьшает давление уровня, иначе компакция не закончится
+        if self.level_size_ratio < self._min_size_ratio:
+            detail = f"The size ratio must not be less than {self._min_size_ratio}"
+            raise ValueError(detail)
+
+        # Выгрузка не должна ждать уровень, давление которого еще не требует компакции
+        if self.compaction == Compaction.LEVELED:
+            if self.level1_stall_size < self.level_base_size:
+                detail = "The stall size must not be less than the base size"
+                raise ValueError(detail)
+
+        elif self.level1_stall_runs < self.level_size_ratio:
+            detail = "The stall runs must not be less than the size ratio"
+            raise ValueError(detail)
+
         self._storage = Storage(self.root)
-        self._wal = WriteAheadLog(self._storage.wal)
-        self._memtable = MemTable(self._wal)
 
-        self._sstables = {
-            serial: SortedStringTable(self._storage.get_level(serial))
-            for serial in range(1, self._number_of_cached_sstables + 1)
-        }
+        # Запрещает фоновым выгрузке и компакции менять таблицы уровней, пока их читают
+        self._levels_lock = threading.Lock()
+
+        # Заполненная `MemTable`, которую выгружает фоновый поток
+        self._immutable: MemTableInterface | None = None
+        self._flusher: threading.Thread | None = None
+
+        self._block_cache: LRUCache[BlockCacheKey, Block] = LRUCache(self.block_cache_capacity)
+
+        self._row_cache: LRUCache[Bytes32, Bytes32] = LRUCache(self.row_cache_capacity)
+        self._negative_cache: LRUCache[Bytes32, bool] = LRUCache(self.negative_cache_capacity)
+
+        # Размер каждой записи - одна таблица, поэтому емкость задается в таблицах
+        self._table_cache: LRUCache[Path, SortedStringTable] = LRUCache(self.table_cache_capacity)
+
+        self._manifest = Manifest(self._storage)
+        self._manifest.collect_garbage()
 
-        merger = Merger()
+        self._merger = Merger(
+            self._manifest,
+            self._create_sstable,
+            self._replace_sstable,
+            self._levels_lock,
+            self.table_size,
+        )
 
         for level in self._storage:
-            merger.merge(level)
+            self._merger.merge(level)
 
-        if self._memtable.size > self._memtable_threshold:
-            self._flush_memtable()
+        self._strategy = self._create_compaction_strategy()
+
+        self._scheduler = CompactionScheduler(self._manifest, self._strategy)
+
+        # Журнал неизменяемой таблицы остается, если процесс прервался до конца выгрузки
+        if self._storage.immutable_wal.exists():
+            wal = self._create_wal(self._storage.immutable_wal)
+            self._start_flush(self.memtable_factory(wal))
+
+        self._wal = self._create_wal(self._storage.wal)
+        self._memtable = self.memtable_factory(self._wal)
+
+        if self._memtable.size > self.memtable_threshold:
+            self._rotate_memtable()
 
     def __setitem__(self: Self, key: bytes, value: bytes) -> None:
         """Установить значение по ключу."""
@@ -66,8 +186,10 @@ class LSMTree:
         value32 = Bytes32(value)
 
         self._memtable.put(key32, value32)
-        if self._memtable.size > self._memtable_threshold:
-            self._flush_memtable()
+        self._invalidate(key32)
+
+        if self._memtable.size > self.memtable_threshold:
+            self._rotate_memtable()
 
     def __delitem__(self: Self, key: bytes) -> None:
         """Удалить значение по ключу."""
@@ -82,8 +204,18 @@ class LSMTree:
         key32 = Bytes32(key)
 
         self._memtable.put(key32, None)
-        if self._memtable.size > self._memtable_threshold:
-            self._flush_memtable()
+        self._invalidate(key32)
+
+        if self._memtable.size > self.memtable_threshold:
+            self._rotate_memtable()
+
+    def write_batch(self: Self) -> WriteBatch:
+        """Получить пакет записей, применяемый атомарно.
+
+        Примечания:
+            * Пакет попадает в журнал предзаписи одной записью, снабженной контрольной суммой.
+        """
+        return WriteBatch(self._write_batch)
 
     def __getitem__(self: Self, key: bytes) -> bytes:
         """Получить значение по ключу."""
@@ -95,31 +227,47 @@ class LSMTree:
             detail = f"The key {key!r} is too long..."
             raise ValueError(detail)
 
-        key32 = Bytes32(key)
-
-        if key32 in self._memtable:
-            value = self._memtable.get(key32)
-
-            if value is not None:
-                return value
+        value = self._get(Bytes32(key))
 
+        if value is None:
             detail = f"The key {key!r} does not exist"
             raise KeyError(detail)
 
-        for level in self._storage:
-            sstable = self._get_sstable(level)
+        return value
+
+    def get_many(self: Self, keys: Iterable[bytes]) -> dict[bytes, bytes]:
+        """Получить значения по множеству ключей.
+
+        Примечания:
+            * Отсутствующие ключи не попадают в результат;
+            * Каждый прогон уровня просматривается один раз для всех ключей.
+        """
+        keys32: set[Bytes32] = set()
 
-            if key32 in sstable:
-                value = sstable.get(key32)
+        for key in keys:
+            if not isinstance(key, bytes):
+                detail = "The key must be 'bytes'"
+                raise TypeError(detail)
 
-                if value is not None:
-                    return value
+            if not (Bytes32.min_len <= len(key) <= Bytes32.max_len):
+                detail = f"The key {key!r} is too long..."
+                raise ValueError(detail)
 
-                detail = f"The key {key!r} does not exist"
-                raise KeyError(detail)
+            keys32.add(Bytes32(key))
 
-        detail = f"The key {key!r} does not exist"
-        raise KeyError(detail)
+        pending = sorted(keys32)
+        pairs = self._search_memtables(pending)
+
+        with self._levels_lock:
+            for run in self._get_runs():
+                pending = [key32 for key32 in pending if key32 not in pairs]
+
+                if not pending:
+                    break
+
+                pairs.update(self._search_run(run, pending))
+
+        return {key32: value for key32, value in pairs.items() if value is not None}
 
     def __contains__(self: Self, key: bytes) -> bool:
         """Проверить, есть ли ключ в дереве."""
@@ -131,36 +279,375 @@ class LSMTree:
             detail = f"The key '{key!r}' is too long..."
             raise ValueError(detail)
 
-        key32 = Bytes32(key)
+        return self._get(Bytes32(key)) is not None
+
+    def items(
+        self: Self,
+        start: bytes | None = None,
+        stop: bytes | None = None,
+        *,
+        reverse: bool = False,
+    ) -> SortedIterator[tuple[bytes, bytes]]:
+        """Получить итератор по парам, ключи которых лежат в полуинтервале `[start, stop)`.
+
+        Примечания:
+            * Пары выдаются лениво в порядке возрастания ключей или убывания при `reverse=True`;
+            * Каждый источник начинает обход от границы, используя разреженный индекс;
+            * Изменять дерево во время обхода нельзя.
+        """
+        for bound in (start, stop):
+            if bound is not None and not isinstance(bound, bytes):
+                detail = "The bound must be 'bytes'"
+                raise TypeError(detail)
+
+        start32 = None if start is None else Bytes32(start)
+        stop32 = None if stop is None else Bytes32(stop)
+
+        memtables = [self._memtable]
+
+        if (immutable := self._immutable) is not None:
+            memtables.append(immutable)
+
+        # Источники упорядочены от новых к старым: при равных ключах побеждает более новый
+        if reverse:
+            iterators = [memtable.seek_reverse(stop32) for memtable in memtables]
+        else:
+            iterators = [memtable.seek(start32) for memtable in memtables]
+
+        with self._levels_lock:
+            for run in self._get_runs():
+                iterators.append(self._seek_run(run, start32, stop32, reverse=reverse))
+
+        if reverse:
+            return self._get_reverse_range_iterator(iterators, start32)
+
+        return self._get_range_iterator(iterators, stop32)
+
+    def keys(
+        self: Self,
+        start: bytes | None = None,
+        stop: bytes | None = None,
+        *,
+        reverse: bool = False,
+    ) -> SortedIterator[bytes]:
+        """Получить итератор по ключам из полуинтервала `[start, stop)`."""
+        return (key for key, _ in self.items(start, stop, reverse=reverse))
+
+    def values(
+        self: Self,
+        start: bytes | None = None,
+        stop: bytes | None = None,
+        *,
+        reverse: bool = False,
+    ) -> SortedIterator[bytes]:
+        """Получить итератор по значениям ключей из полуинтервала `[start, stop)`."""
+        return (value for _, value in self.items(start, stop, reverse=reverse))
 
-        if key32 in self._memtable:
-            value = self._memtable.get(key32)
-            return value is not None
+    def sync(self: Self) -> None:
+        """Сбросить накопленные записи журнала предзаписи на диск."""
+        self._wal.sync()
 
-        for level in self._storage:
-            sstable = self._get_sstable(level)
-            if key32 in sstable:
-                value = sstable.get(key32)
-                return value is not None
+    def close(self: Self) -> None:
+        """Дождаться фоновых выгрузки и компакции, сбросить журнал и отпустить ресурсы."""
+        try:
+            self._wait_for_flush()
+            self._scheduler.close()
+        finally:
+            self._wal.close()
+
+            self._table_cache.clear()
+            self._block_cache.clear()
+
+    def block_cache_info(self: Self) -> CacheInfo:
+        """Получить статистику кэша блоков."""
+        return self._block_cache.cache_info()
+
+    def table_cache_info(self: Self) -> CacheInfo:
+        """Получить статистику кэша таблиц."""
+        return self._table_cache.cache_info()
+
+    def row_cache_info(self: Self) -> CacheInfo:
+        """Получить статистику кэша горячих пар."""
+        return self._row_cache.cache_info()
+
+    def negative_cache_info(self: Self) -> CacheInfo:
+        """Получить статистику кэша отсутствующих ключей."""
+        return self._negative_cache.cache_info()
+
+    def compaction_info(self: Self) -> CompactionInfo:
+        """Получить статистику слияний: отброшенные надгробия и освобожденное место."""
+        return self._merger.compaction_info()
+
+    def _get(self: Self, key: Bytes32) -> Bytes32 | None:
+        """Получить значение по ключу или `None`, если ключа нет.
+
+        Примечания:
+            * Сначала проверяются кэши пар и отсутствующих ключей;
+            * Результат поиска по уровням попадает в соответствующий кэш.
+        """
+        value = self._row_cache.get(key)
+
+        if value is not None:
+            return value
+
+        if self._negative_cache.get(key):
+            return None
+
+        if key in self._memtable:
+            return self._memtable.get(key)
+
+        immutable = self._immutable
+
+        if immutable is not None and key in immutable:
+            return immutable.get(key)
+
+        value = self._search(key)
+
+        if value is None:
+            self._negative_cache.put(key, value=True, size=getsizeof(key))
+        else:
+            self._row_cache.put(key, value, getsizeof(key) + getsizeof(value))
+
+        return value
+
+    def _search(self: Self, key: Bytes32) -> Bytes32 | None:
+        """Найти значение по ключу на уровнях или получить `None`, если ключа нет."""
+        with self._levels_lock:
+            for run in self._get_runs():
+                info = run.find(key)
+
+                if info is None:
+                    continue
 
-        return False
+                sstable = self._get_sstable(info.table)
 
-    def _get_sstable(self: Self, level: Level) -> SortedStringTable:
-        """Получить `SSTable` для данного уровня."""
-        if level.serial < len(self._sstables):
-            return self._sstables[level.serial]
+                try:
+                    return sstable.get(key)
+                except KeyError:
+                    continue
 
-        level = self._storage.get_level(level.serial)
-        return SortedStringTable(level)
+        return None
 
-    def _flush_memtable(self: Self) -> None:
-        """Перенести данные из RAM на диск."""
-        level = self._storage.get_first_level()
+    def _search_memtables(self: Self, keys: list[Bytes32]) -> dict[Bytes32, Bytes32 | None]:
+        """Найти ключи в `MemTable` и получить найденные пары, включая надгробия."""
+        memtables = [self._memtable]
 
-        sstable = self._get_sstable(level)
-        sstable.from_iterable(iter(self._memtable))
+        if (immutable := self._immutable) is not None:
+            memtables.append(immutable)
+
+        pairs: dict[Bytes32, Bytes32 | None] = {}
+
+        for key in keys:
+            memtable = next((memtable for memtable in memtables if key in memtable), None)
+
+            if memtable is not None:
+                pairs[key] = memtable.get(key)
+
+        return pairs
+
+    def _search_run(
+        self: Self,
+        run: Run,
+        keys: list[Bytes32],
+    ) -> dict[Bytes32, Bytes32 | None]:
+        """Найти ключи в прогоне и получить найденные пары, включая надгробия.
+
+        Примечания:
+            * Ключи раскладываются по таблицам прогона, и каждая таблица читается один раз.
+        """
+        groups: dict[Path, tuple[Table, list[Bytes32]]] = {}
+
+        for key in keys:
+            info = run.find(key)
+
+            if info is not None:
+                groups.setdefault(info.table.path, (info.table, []))[1].append(key)
+
+        pairs: dict[Bytes32, Bytes32 | None] = {}
+
+        for table, table_keys in groups.values():
+            sstable = self._get_sstable(table)
+            pairs.update(sstable.get_many(table_keys))
+
+        return pairs
+
+    def _write_batch(self: Self, pairs: list[tuple[Bytes32, Bytes32 | None]]) -> None:
+        """Применить пакет записей."""
+        self._memtable.put_many(pairs)
+
+        for key, _ in pairs:
+            self._invalidate(key)
+
+        if self._memtable.size > self.memtable_threshold:
+            self._rotate_memtable()
+
+    def _invalidate(self: Self, key: Bytes32) -> None:
+        """Сбросить закэшированный результат поиска по ключу."""
+        self._row_cache.pop(key)
+        self._negative_cache.pop(key)
+
+    def _get_range_iterator(
+        self: Self,
+        iterators: list[Iterator[tuple[Bytes32, Bytes32 | None]]],
+        stop: Bytes32 | None,
+    ) -> SortedIterator[tuple[bytes, bytes]]:
+        """Слить источники, скрыв надгробия и ключи не меньше `stop`."""
+        for key, value in merged(*iterators):
+            if stop is not None and key >= stop:
+                return
+
+            if value is not None:
+                yield (key, value)
+
+    def _get_reverse_range_iterator(
+        self: Self,
+        iterators: list[Iterator[tuple[Bytes32, Bytes32 | None]]],
+        start: Bytes32 | None,
+    ) -> SortedIterator[tuple[bytes, bytes]]:
+        """Слить убывающие источники, скрыв надгробия и ключи меньше `start`."""
+        for key, value in merged(*iterators, reverse=True):
+            if start is not None and key < start:
+                return
+
+            if value is not None:
+                yield (key, value)
+
+    def _get_runs(self: Self) -> Iterator[Run]:
+        """Получить итератор по прогонам уровней от новых к старым."""
+        for _, runs in self._manifest:
+            yield from runs
+
+    def _seek_run(
+        self: Self,
+        run: Run,
+        start: Bytes32 | None,
+        stop: Bytes32 | None,
+        *,
+        reverse: bool = False,
+    ) -> Iterator[tuple[Bytes32, Bytes32 | None]]:
+        """Получить итератор по таблицам прогона, пересекающим полуинтервал `[start, stop)`.
+
+        Примечания:
+            * Таблицы прогона не пересекаются, поэтому их итераторы просто идут друг за другом;
+            * Итераторы создаются сразу: после публикации слияния файлы таблиц могут исчезнуть.
+        """
+        infos = run.get_overlapping(start, stop)
+        iterators: list[Iterator[tuple[Bytes32, Bytes32 | None]]] = []
+
+        for info in reversed(infos) if reverse else infos:
+            sstable = self._get_sstable(info.table)
+
+            if reverse:
+                iterators.append(sstable.seek_reverse(stop))
+            else:
+                iterators.append(sstable.seek(start))
+
+        return itertools.chain.from_iterable(iterators)
+
+    def _get_sstable(self: Self, table: Table) -> SortedStringTable:
+        """Получить `SSTable` для чтения данной таблицы.
+
+        Примечания:
+            * Таблица создается при первом обращении и вытесняется, если давно не использовалась.
+        """
+        sstable = self._table_cache.get(table.path)
+
+        if sstable is None:
+            sstable = SortedStringTable(table, self.bloom_filter_policy, self._block_cache)
+            self._table_cache.put(table.path, sstable, 1)
+
+        return sstable
+
+    def _replace_sstable(self: Self, table: Table) -> None:
+        """Сбросить закэшированную `SSTable` после удаления таблицы."""
+        sstable = self._table_cache.pop(table.path)
+
+        if sstable is not None:
+            sstable.close()
+
+    def _create_sstable(self: Self, table: Table, serial: PositiveInt) -> SortedStringTable:
+        """Создать `SSTable` для таблицы уровня под данным номером."""
+        position = min(serial, len(self.compression_per_level)) - 1
+        compression = self.compression_per_level[position]
+
+        return SortedStringTable(table, self.bloom_filter_policy, self._block_cache, compression)
+
+    def _create_compaction_strategy(self: Self) -> CompactionStrategy:
+        """Создать стратегию компакции."""
+        if self.compaction == Compaction.SIZE_TIERED:
+            return SizeTieredCompaction(
+                self._manifest,
+                self._merger,
+                self.level_size_ratio,
+                self.level1_stall_runs,
+            )
+
+        return LeveledCompaction(
+            self._manifest,
+            self._merger,
+            self.level_base_size,
+            self.level_size_ratio,
+            self.level1_stall_size,
+        )
+
+    def _create_wal(self: Self, path: Path) -> WriteAheadLog:
+        """Создать журнал предзаписи по данному пути."""
+        return WriteAheadLog(path, self.durability, self.wal_group_size, self.wal_group_interval)
+
+    def _rotate_memtable(self: Self) -> None:
+        """Заморозить заполненную `MemTable` и передать таблицу фоновой выгрузке.
+
+        Примечания:
+            * Записи сразу принимают новые журнал и `MemTable`;
+            * Если предыдущая выгрузка еще идет, запись ждет окончания выгрузки.
+        """
+        self._wait_for_flush()
+
+        self._wal.close()
+        self._storage.wal.rename(self._storage.immutable_wal)
+
+        memtable = self._memtable
+
+        self._wal = self._create_wal(self._storage.wal)
+        self._memtable = self.memtable_factory(self._wal)
+
+        self._start_flush(memtable)
+
+    def _start_flush(self: Self, memtable: MemTableInterface) -> None:
+        """Сделать `MemTable` неизменяемой и запустить фоновую выгрузку таблицы."""
+        self._immutable = memtable
+
+        self._flusher = threading.Thread(target=self._flush_immutable, args=(memtable,))
+        self._flusher.start()
+
+    def _wait_for_flush(self: Self) -> None:
+        """Дождаться окончания фоновой выгрузки.
+
+        Примечания:
+            * Если фоновая выгрузка завершилась ошибкой, она повторяется в текущем потоке.
+        """
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+
+        if self._immutable is not None:
+            self._flush_immutable(self._immutable)
 
-        merger = Merger()
-        merger.merge(level)
+    def _flush_immutable(self: Self, memtable: MemTableInterface) -> None:
+        """Выгрузить неизменяемую `MemTable` и перестать учитывать таблицу при чтении."""
+        self._flush_memtable(memtable)
+        self._immutable = None
+
+    def _flush_memtable(self: Self, memtable: MemTableInterface) -> None:
+        """Перенести данные неизменяемой `MemTable` из RAM на первый уровень.
 
-        self._memtable.clear()
+        Примечания:
+            * Компакция нижних уровней идет отдельно и выгрузку не задерживает;
+            * Журнал таблицы удаляется лишь после публикации первого уровня.
+        """
+        if next(iter(memtable), None) is not None:
+            with self._scheduler.reserve_first_level() as serial:
+                self._strategy.flush(serial, iter(memtable))
+
+        memtable.wal.close()
+        self._storage.immutable_wal.unlink(missing_ok=True)
@@ -0,0 +1,94 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self
+
+from lsmtree.domain.dtypes.bytes32 import Bytes32
+from lsmtree.utils.typing import NonNegativeInt
+
+
+@dataclass
+class WriteBatch:
+    """Пакет записей, применяемый к дереву атомарно.
+
+    Примечания:
+        * Контекстный менеджер применяет пакет при выходе без исключения;
+        * Из нескольких записей по одному ключу остается последняя.
+    """
+
+    on_commit: Callable[[list[tuple[Bytes32, Bytes32 | None]]], None]
+
+    _pairs: dict[Bytes32, Bytes32 | None] = field(default_factory=dict)
+    _is_committed: bool = False
+
+    def put(self: Self, key: bytes, value: bytes) -> None:
+        """Установить значение по ключу."""
+        if not isinstance(key, bytes):
+            detail = "The key must be 'bytes'"
+            raise TypeError(detail)
+
+        if not isinstance(value, bytes):
+            detail = "The value must be 'bytes'"
+            raise TypeError(detail)
+
+        if not (Bytes32.min_len <= len(key) <= Bytes32.max_len):
+            detail = f"The key {key!r} is too long..."
+            raise ValueError(detail)
+
+        if not (Bytes32.min_len <= len(value) <= Bytes32.max_len):
+            detail = f"The value {value!r} is too long..."
+            raise ValueError(detail)
+
+        self._guarantee_pending()
+        self._pairs[Bytes32(key)] = Bytes32(value)
+
+    def delete(self: Self, key: bytes) -> None:
+        """Удалить значение по ключу."""
+        if not isinstance(key, bytes):
+            detail = "The key must be 'bytes'"
+            raise TypeError(detail)
+
+        if not (Bytes32.min_len <= len(key) <= Bytes32.max_len):
+            detail = f"The key {key!r} is too long..."
+            raise ValueError(detail)
+
+        self._guarantee_pending()
+        self._pairs[Bytes32(key)] = None
+
+    def commit(self: Self) -> None:
+        """Применить пакет к дереву."""
+        self._guarantee_pending()
+        self._is_committed = True
+
+        if self._pairs:
+            self.on_commit(list(self._pairs.items()))
+
+        self._pairs.clear()
+
+    def __len__(self: Self) -> NonNegativeInt:
+        """Получить число записей в пакете."""
+        return len(self._pairs)
+
+    def __enter__(self: Self) -> Self:
+        """Начать пакет."""
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Применить пакет, если исключения не возникло, иначе отбросить пакет."""
+        if exc_type is not None:
+            self._pairs.clear()
+            return
+
+        if not self._is_committed:
+            self.commit()
+
+    def _guarantee_pending(self: Self) -> None:
+        """Убедиться, что пакет еще не применен."""
+        if self._is_committed:
+            detail = "The batch is already committed"
+            raise RuntimeError(detail)
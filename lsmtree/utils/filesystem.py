@@ -0,0 +1,13 @@
+import os
+
+from lsmtree.utils.typing import DirectoryPath
+
+
+def fsync_directory(path: DirectoryPath) -> None:
+    """Сбросить на диск записи директории: созданные, переименованные и удаленные файлы."""
+    descriptor = os.open(path, os.O_RDONLY)
+
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -1,11 +1,15 @@
 from collections.abc import Generator, Iterable
-from itertools import islice
+from heapq import merge
+from itertools import groupby, islice
+from operator import itemgetter
 from typing import TypeVar
 
-from lsmtree.utils.typing import NonNegativeInt
+from lsmtree.utils.typing import NonNegativeInt, SortedIterable
 
 
+K = TypeVar("K")
 T = TypeVar("T")
+V = TypeVar("V")
 
 
 def distanced(iterable: Iterable[T], distance: NonNegativeInt) -> Generator[T, None, None]:
@@ -20,3 +24,19 @@ def batched(iterable: Iterable[T], n: int = 100) -> Generator[tuple[T, ...], Non
     iterator = iter(iterable)
     while batch := tuple(islice(iterator, n)):
         yield batch
+
+
+def merged(
+    *iterables: SortedIterable[tuple[K, V]],
+    reverse: bool = False,
+) -> Generator[tuple[K, V], None, None]:
+    """Слить упорядоченные по ключу последовательности пар.
+
+    Примечания:
+        * Из пар, ключи которых совпадают, остается пара из самой левой последовательности;
+        * При `reverse=True` последовательности должны убывать по ключу.
+    """
+    iterator = merge(*iterables, key=itemgetter(0), reverse=reverse)
+
+    for _, group in groupby(iterator, key=itemgetter(0)):
+        yield next(group)
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Annotated, TypeAlias
 
 
-@dataclass
+@dataclass(frozen=True)
 class IntCompare:
     """Сравнение целых чисел."""
 
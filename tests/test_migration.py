@@ -0,0 +1,52 @@
+import struct
+
+from pathlib import Path
+
+from lsmtree.presentation.lsmtree import LSMTree
+
+
+# Расстояние между ключами разреженного индекса первой версии
+DISTANCE = 33
+
+
+def write_legacy_level(path: Path, pairs: list[tuple[bytes, bytes]]) -> None:
+    """Записать уровень в формате первой версии дерева.
+
+    Примечания:
+        * Индекс не имеет заголовка, смещения в нем 128-байтные;
+        * Смещения не учитывают заголовки записей и указывают в середину записей;
+        * Индексу доверяют: метка доверия лежит рядом.
+    """
+    path.mkdir(parents=True)
+
+    sstable = bytearray()
+    sparse_index = bytearray()
+    payload = 0
+
+    for serial, (key, value) in enumerate(pairs):
+        if serial % DISTANCE == 0:
+            sparse_index += struct.pack(">I", len(key)) + key + payload.to_bytes(128)
+
+        sstable += struct.pack(">I", len(key)) + key + b"\x00"
+        sstable += struct.pack(">I", len(value)) + value
+        payload += len(key) + len(value)
+
+    (path / "sstable.db").write_bytes(sstable)
+    (path / "sparse-index.db").write_bytes(sparse_index)
+    (path / "sparse-index-ack.db").touch()
+
+
+def test_legacy_level_with_trusted_index_is_migrated(tmp_path: Path) -> None:
+    """Проверить, что уровень первой версии, индексу которого доверяют, читается после миграции."""
+    pairs = [(b"key%06d" % serial, b"value-%d" % serial) for serial in range(1000)]
+    write_legacy_level(tmp_path / "levels" / "1", pairs)
+
+    tree = LSMTree(tmp_path)
+
+    try:
+        for key, value in pairs:
+            assert tree[key] == value
+
+        assert [key for key, _ in tree.items()] == [key for key, _ in pairs]
+    finally:
+        tree.close()